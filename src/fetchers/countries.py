@@ -5,8 +5,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-import pandas as pd
-
 from ..generators.summariser import Summarizer
 from ..settings import settings
 from ..utils.logger import get_logger
@@ -92,26 +90,27 @@ class CountriesFetcher:
             return self.countries
             
         try:
-            # Read CSV file
-            df = pd.read_csv(self.csv_path)
+            # Read CSV file; empty cells come through as empty strings
+            with open(self.csv_path, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
             
             countries = []
-            for _, row in df.iterrows():
+            for row in rows:
                 # Parse languages and currencies
-                languages = row.get('Languages', '').split('|') if pd.notna(row.get('Languages')) else []
-                currencies = row.get('Currencies', '').split('|') if pd.notna(row.get('Currencies')) else []
+                languages = row.get('Languages') or ''
+                currencies = row.get('Currencies') or ''
                 
                 country = Country(
                     name=row['Country'],
                     capital=row['Capital'],
-                    region=row.get('Region', ''),
-                    subregion=row.get('Subregion', ''),
-                    population=int(row.get('Population', 0)),
-                    area=float(row.get('Area', 0)),
-                    languages=[lang.strip() for lang in languages],
-                    currencies=[curr.strip() for curr in currencies],
-                    lat=float(row.get('Latitude', 0)),
-                    lng=float(row.get('Longitude', 0)),
+                    region=row.get('Region') or '',
+                    subregion=row.get('Subregion') or '',
+                    population=int(row.get('Population') or 0),
+                    area=float(row.get('Area') or 0),
+                    languages=[lang.strip() for lang in languages.split('|') if lang],
+                    currencies=[curr.strip() for curr in currencies.split('|') if curr],
+                    lat=float(row.get('Latitude') or 0),
+                    lng=float(row.get('Longitude') or 0),
                 )
                 countries.append(country)
             
@@ -34,14 +34,18 @@ class TrendingRepo:
 class GitHubTrendingFetcher:
     """Fetches trending repositories from GitHub."""
     
-    def __init__(self):
-        """Initialize the GitHub trending fetcher."""
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-        )
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize the GitHub trending fetcher.
+        
+        Args:
+            client: Shared HTTP client to use; the fetcher creates and closes
+                its own client when omitted
+        """
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+        }
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=30.0)
         
     async def __aenter__(self):
         """Async context manager entry."""
@@ -49,7 +53,8 @@ class GitHubTrendingFetcher:
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
     
     @async_retry(max_attempts=3, initial_delay=2.0)
     async def fetch_trending_page(self) -> str:
@@ -58,7 +63,7 @@ class GitHubTrendingFetcher:
         Returns:
             HTML content of the trending page
         """
-        response = await self.client.get(GITHUB_TRENDING_URL)
+        response = await self.client.get(GITHUB_TRENDING_URL, headers=self.headers)
         response.raise_for_status()
         
         logger.info("Fetched GitHub trending page")
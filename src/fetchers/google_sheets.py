@@ -2,10 +2,11 @@
 import asyncio
 import random
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 import gspread
+import httpx
 from google.auth.exceptions import GoogleAuthError
 
 from ..settings import settings
@@ -18,6 +19,13 @@ logger = get_logger(__name__)
 # Google Sheets document ID (from the URL)
 SHEETS_DOCUMENT_ID = "1pMNR5i3v1T-N63QnR_03X7ARWRR9PWJ3j0NP_jd4d7M"
 
+# Worksheet row counts by (document, sheet), kept for the current day only
+_ROW_COUNT_CACHE: Dict[date, Dict[Tuple[str, str], int]] = {}
+
+# Row count query; a row is counted if its first column (the term or
+# phrase) or its second (the definition or translation) is filled
+ROW_COUNT_QUERY = "select count(A), count(B)"
+
 
 @dataclass
 class TranscriptRecord:
@@ -49,10 +57,16 @@ class SpanishRecord:
 class GoogleSheetsFetcher:
     """Fetches data from Google Sheets via gspread."""
     
-    def __init__(self):
-        """Initialize the Google Sheets fetcher."""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize the Google Sheets fetcher.
+        
+        Args:
+            http_client: Shared HTTP client to use; a short-lived client is
+                created per request when omitted
+        """
         self.client = None
         self.document = None
+        self.http_client = http_client
         
     async def __aenter__(self):
         """Async context manager entry."""
@@ -82,32 +96,44 @@ class GoogleSheetsFetcher:
             logger.error(f"Google Sheets connection failed: {e}")
             return False
     
+    async def _get(self, url: str) -> httpx.Response:
+        """Fetch a URL with the shared HTTP client if one was provided.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            HTTP response
+        """
+        if self.http_client is not None:
+            return await self.http_client.get(url, follow_redirects=True)
+        
+        async with httpx.AsyncClient() as client:
+            return await client.get(url, follow_redirects=True)
+    
     async def _find_sheet_gid(self, sheet_name: str) -> str:
         """Try to find the correct GID for a worksheet by trying different values."""
-        import httpx
-        
         # Common GID patterns to try
         gids_to_try = ["0", "1", "2", "3", "4", "5"]
         
         for gid in gids_to_try:
             try:
                 csv_url = f"https://docs.google.com/spreadsheets/d/{self.document}/export?format=csv&gid={gid}"
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(csv_url, follow_redirects=True)
-                    if response.status_code == 200 and response.text.strip():
-                        # Check if this looks like the right sheet by examining headers
-                        lines = response.text.strip().split('\n')
-                        if lines:
-                            headers = lines[0].lower()
-                            if sheet_name == "Transcript_Summaries" and ("date" in headers or "url" in headers or "title" in headers):
-                                logger.info(f"Found GID {gid} for worksheet '{sheet_name}'")
-                                return gid
-                            elif sheet_name == "cs_terms" and ("term" in headers or "definition" in headers):
-                                logger.info(f"Found GID {gid} for worksheet '{sheet_name}'")
-                                return gid
-                            elif sheet_name == "espanol" and ("español" in headers or "ingles" in headers or "english" in headers or "spanish" in headers):
-                                logger.info(f"Found GID {gid} for worksheet '{sheet_name}'")
-                                return gid
+                response = await self._get(csv_url)
+                if response.status_code == 200 and response.text.strip():
+                    # Check if this looks like the right sheet by examining headers
+                    lines = response.text.strip().split('\n')
+                    if lines:
+                        headers = lines[0].lower()
+                        if sheet_name == "Transcript_Summaries" and ("date" in headers or "url" in headers or "title" in headers):
+                            logger.info(f"Found GID {gid} for worksheet '{sheet_name}'")
+                            return gid
+                        elif sheet_name == "cs_terms" and ("term" in headers or "definition" in headers):
+                            logger.info(f"Found GID {gid} for worksheet '{sheet_name}'")
+                            return gid
+                        elif sheet_name == "espanol" and ("español" in headers or "ingles" in headers or "english" in headers or "spanish" in headers):
+                            logger.info(f"Found GID {gid} for worksheet '{sheet_name}'")
+                            return gid
             except Exception:
                 continue
         
@@ -115,17 +141,21 @@ class GoogleSheetsFetcher:
         return "0"
 
     @async_retry(max_attempts=3, initial_delay=1.0)
-    async def _get_worksheet_data(self, sheet_name: str) -> List[Dict[str, Any]]:
+    async def _get_worksheet_data(
+        self,
+        sheet_name: str,
+        query: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """Get all data from a specific worksheet using CSV export.
         
         Args:
             sheet_name: Name of the worksheet to fetch
+            query: Optional Google Visualization query to run on the sheet
             
         Returns:
             List of row dictionaries
         """
         try:
-            import httpx
             import csv
             import io
             import urllib.parse
@@ -135,15 +165,16 @@ class GoogleSheetsFetcher:
             
             # Use the gviz URL format which works with sheet names
             csv_url = f"https://docs.google.com/spreadsheets/d/{self.document}/gviz/tq?tqx=out:csv&sheet={encoded_name}"
+            if query:
+                csv_url += f"&tq={urllib.parse.quote(query)}"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(csv_url, follow_redirects=True)
-                response.raise_for_status()
-                
-                # Parse CSV data - gviz format uses quoted CSV
-                csv_content = response.text
-                csv_reader = csv.DictReader(io.StringIO(csv_content))
-                records = list(csv_reader)
+            response = await self._get(csv_url)
+            response.raise_for_status()
+            
+            # Parse CSV data - gviz format uses quoted CSV
+            csv_content = response.text
+            csv_reader = csv.DictReader(io.StringIO(csv_content))
+            records = list(csv_reader)
             
             logger.info(f"Fetched {len(records)} records from worksheet '{sheet_name}' via CSV")
             return records
@@ -234,6 +265,150 @@ class GoogleSheetsFetcher:
             logger.error(f"Failed to fetch transcripts: {e}")
             return []
     
+    async def _get_row_count(self, sheet_name: str) -> int:
+        """Get the number of data rows in a worksheet, cached for the day.
+        
+        Assumes every row fills column A or B; rows blank in both are not
+        counted, so the last such rows could never be picked by offset.
+        
+        Args:
+            sheet_name: Name of the worksheet
+            
+        Returns:
+            Number of data rows (0 if unknown)
+        """
+        today = date.today()
+        if today not in _ROW_COUNT_CACHE:
+            # Drop previous days' counts so the cache never grows
+            _ROW_COUNT_CACHE.clear()
+            _ROW_COUNT_CACHE[today] = {}
+        day_cache = _ROW_COUNT_CACHE[today]
+        
+        cache_key = (self.document, sheet_name)
+        if cache_key in day_cache:
+            return day_cache[cache_key]
+        
+        records = await self._get_worksheet_data(sheet_name, query=ROW_COUNT_QUERY)
+        try:
+            row_count = max(int(float(value)) for value in records[0].values())
+        except (IndexError, TypeError, ValueError):
+            logger.warning(f"Could not determine row count for worksheet '{sheet_name}'")
+            return 0
+        
+        day_cache[cache_key] = row_count
+        return row_count
+    
+    async def fetch_random_row(self, sheet_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch a single random row from a worksheet.
+        
+        Args:
+            sheet_name: Name of the worksheet
+            
+        Returns:
+            Row dictionary, or None if the sheet is empty or unavailable
+        """
+        row_count = await self._get_row_count(sheet_name)
+        if row_count <= 0:
+            return None
+        
+        offset = random.randrange(row_count)
+        records = await self._get_worksheet_data(
+            sheet_name, query=f"select * limit 1 offset {offset}"
+        )
+        return records[0] if records else None
+    
+    def _parse_cs_term(self, record_id: str, record: Dict[str, Any]) -> Optional[CSTermRecord]:
+        """Parse a CS term worksheet row.
+        
+        Args:
+            record_id: ID to assign to the record
+            record: Row dictionary
+            
+        Returns:
+            CS term record, or None if the row is incomplete
+        """
+        # CS Terms uses "Concept" and "Define" columns
+        term = record.get("Concept", "").strip()
+        definition = record.get("Define", "").strip()
+        category = record.get("Category", "").strip() or None
+        
+        if not (term and definition):
+            return None
+        
+        return CSTermRecord(
+            id=record_id,
+            term=term,
+            definition=definition,
+            category=category,
+        )
+    
+    def _parse_spanish_phrase(self, record_id: str, record: Dict[str, Any]) -> Optional[SpanishRecord]:
+        """Parse a Spanish phrase worksheet row.
+        
+        Args:
+            record_id: ID to assign to the record
+            record: Row dictionary
+            
+        Returns:
+            Spanish phrase record, or None if the row is incomplete
+        """
+        # Get English phrase - column is "en ingles"
+        english = record.get("en ingles", "").strip()
+        
+        # Get Spanish phrase - column is "En español"
+        spanish = record.get("En español", "").strip()
+        category = record.get("Category", "").strip() or None
+        
+        if not (english and spanish):
+            return None
+        
+        return SpanishRecord(
+            id=record_id,
+            english=english,
+            spanish=spanish,
+            category=category,
+        )
+    
+    async def fetch_random_cs_term(self) -> Optional[CSTermRecord]:
+        """Fetch a single random CS term.
+        
+        Only one row is downloaded; if it is incomplete, falls back to
+        choosing from the full list.
+        
+        Returns:
+            CS term record, or None if none are available
+        """
+        try:
+            record = await self.fetch_random_row("cs_terms")
+            term = self._parse_cs_term("random", record) if record else None
+            if term:
+                return term
+        except Exception as e:
+            logger.warning(f"Failed to fetch random CS term: {e}")
+        
+        terms = await self.fetch_all_cs_terms()
+        return random.choice(terms) if terms else None
+    
+    async def fetch_random_spanish_phrase(self) -> Optional[SpanishRecord]:
+        """Fetch a single random Spanish phrase.
+        
+        Only one row is downloaded; if it is incomplete, falls back to
+        choosing from the full list.
+        
+        Returns:
+            Spanish phrase record, or None if none are available
+        """
+        try:
+            record = await self.fetch_random_row("espanol")
+            phrase = self._parse_spanish_phrase("random", record) if record else None
+            if phrase:
+                return phrase
+        except Exception as e:
+            logger.warning(f"Failed to fetch random Spanish phrase: {e}")
+        
+        phrases = await self.fetch_all_spanish_phrases()
+        return random.choice(phrases) if phrases else None
+    
     async def fetch_all_cs_terms(self) -> List[CSTermRecord]:
         """Fetch all CS terms from the database.
         
@@ -246,18 +421,8 @@ class GoogleSheetsFetcher:
             terms = []
             for i, record in enumerate(records):
                 try:
-                    # CS Terms uses "Concept" and "Define" columns
-                    term = record.get("Concept", "").strip()
-                    definition = record.get("Define", "").strip()
-                    category = record.get("Category", "").strip() or None
-                    
-                    if term and definition:
-                        cs_term = CSTermRecord(
-                            id=str(i),
-                            term=term,
-                            definition=definition,
-                            category=category,
-                        )
+                    cs_term = self._parse_cs_term(str(i), record)
+                    if cs_term:
                         terms.append(cs_term)
                     
                 except Exception as e:
@@ -283,20 +448,8 @@ class GoogleSheetsFetcher:
             phrases = []
             for i, record in enumerate(records):
                 try:
-                    # Get English phrase - column is "en ingles"
-                    english = record.get("en ingles", "").strip()
-                    
-                    # Get Spanish phrase - column is "En español"
-                    spanish = record.get("En español", "").strip()
-                    category = record.get("Category", "").strip() or None
-                    
-                    if english and spanish:
-                        phrase = SpanishRecord(
-                            id=str(i),
-                            english=english,
-                            spanish=spanish,
-                            category=category,
-                        )
+                    phrase = self._parse_spanish_phrase(str(i), record)
+                    if phrase:
                         phrases.append(phrase)
                     
                 except Exception as e:
@@ -321,12 +474,10 @@ class GoogleSheetsFetcher:
                 return False
                 
             # Test CSV access by trying to fetch the first sheet
-            import httpx
             csv_url = f"https://docs.google.com/spreadsheets/d/{self.document}/export?format=csv&gid=0"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(csv_url, follow_redirects=True)
-                response.raise_for_status()
+            response = await self._get(csv_url)
+            response.raise_for_status()
             
             logger.info(
                 "Google Sheets connection test successful",
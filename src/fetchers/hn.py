@@ -35,9 +35,15 @@ class Article:
 class HackerNewsFetcher:
     """Fetches and filters top Hacker News articles."""
     
-    def __init__(self):
-        """Initialize the HN fetcher."""
-        self.client = httpx.AsyncClient(timeout=30.0)
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize the HN fetcher.
+        
+        Args:
+            client: Shared HTTP client to use; the fetcher creates and closes
+                its own client when omitted
+        """
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=30.0)
         
     async def __aenter__(self):
         """Async context manager entry."""
@@ -45,7 +51,8 @@ class HackerNewsFetcher:
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
     
     @async_retry(max_attempts=3, initial_delay=1.0)
     async def fetch_top_stories(self, limit: int = 10) -> List[int]:
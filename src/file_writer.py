@@ -1,10 +1,10 @@
 """File writer module for saving daily briefings and Excel tables."""
-import shutil
-from datetime import datetime
+import csv
+import functools
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import pandas as pd
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
@@ -14,6 +14,74 @@ from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Cumulative table rows; each day's XLSX is rebuilt from this file
+TABLE_CSV_NAME = "Table.csv"
+
+# Expected column order, based on the template
+ORDERED_FIELDS = (
+    "Date",
+    "FULLDATE",
+    "YC_ARTICLE_PICK",
+    "YC_ARTICLE_SUMMARY",
+    "YC_ARTICLE_KEYPOINTS",
+    "YC_ARTICLE_KEYWORDS",
+    "GITHUB_TRENDING_MCP_NAME",
+    "GITHUB_TRENDING_MCP_SUMMARY",
+    "TRANSCRIPT_TABLE",
+    "COUNTRY_OF_THE_DAY",
+    "COUNTRY_CAPITAL_OF_THE_DAY",
+    "CAPITAL_LOCATION_BREAKDOWN",
+    "GET_TO_IT_SAYING",
+    "CODEBASE_TODAY",
+    "CODEBASE_SUMMARY",
+    "DAYS_LEFT",
+    "CURRENT_STUDY_YEAR",
+    "CURRENT_STUDY_STATE",
+    "CURRENT_YEAR_BEST_PICTURE",
+    "CURRENT_YEAR_BEST_ACTOR_IN_PICTURE",
+    "CURRENT_YEAR_BEST_CINEMATOGRAPHY",
+    "CURRENT_YEAR_BEST_SCORE",
+    "CURRENT_YEAR_BEST_FOREIGN_FILM",
+    "MAJOR_INVENTION_OF_YEAR",
+    "MAJOR_INVENTION_SUMMARY",
+    "CURRENT_GOLF_STATE_SUMMARY",
+    "CURRENT_YEAR_US_PRESIDENT_VPS",
+    "NEW_MAJOR_PRESIDENTIAL_DECISION",
+    "WW1_FACT",
+    "WW2_FACT",
+    "EUROPE_FACT",
+    "IRELAND_FACT",
+    "JERUSALEM_FACT",
+    "INDIA_FACT",
+    "MEXICO_FACT",
+    "STUNT_RIGGING_SUMMARY",
+    "BIKE_FUN_FACT",
+    "NASA_LAUNCH_HISTORY",
+    "TEACH_ME_GC",
+    "QUIZ_ME_CS_TERM",
+    "QUIZ_ME_ESPANOL",
+)
+_ORDERED_FIELD_SET = frozenset(ORDERED_FIELDS)
+
+
+@functools.lru_cache(maxsize=64)
+def _format_date(day: date) -> str:
+    """Format a date for filenames (MM.DD.YY)."""
+    return day.strftime("%m.%d.%y")
+
+
+@functools.lru_cache(maxsize=64)
+def _headers_for_keys(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Order context keys as table headers.
+    
+    Args:
+        keys: Context keys in insertion order
+        
+    Returns:
+        Template-ordered fields followed by any additional keys
+    """
+    return ORDERED_FIELDS + tuple(key for key in keys if key not in _ORDERED_FIELD_SET)
+
 
 class FileWriter:
     """Handles writing daily briefings to TXT and XLSX files."""
@@ -34,7 +102,7 @@ class FileWriter:
         """
         if date is None:
             date = datetime.now()
-        return date.strftime("%m.%d.%y")
+        return _format_date(date.date())
     
     def write_daily_txt(self, content: str, date: Optional[datetime] = None) -> Path:
         """Write daily briefing to TXT file.
@@ -114,6 +182,10 @@ class FileWriter:
     def update_table_xlsx(self, context: Dict[str, Any], date: Optional[datetime] = None) -> Path:
         """Update the cumulative XLSX table with new daily data.
         
+        The row is added to the cumulative CSV under its existing header, and
+        the day's XLSX is rebuilt from it. Running again on the same date
+        replaces that date's row rather than adding a second one.
+        
         Args:
             context: Dictionary of all briefing data
             date: Date for the briefing (defaults to today)
@@ -127,28 +199,46 @@ class FileWriter:
         filepath = settings.tables_dir / filename
         
         try:
-            # Get the latest XLSX file
-            latest_file = self._get_latest_xlsx_file()
+            csv_path = settings.tables_dir / TABLE_CSV_NAME
+            if not csv_path.exists():
+                self._seed_table_csv(csv_path, context)
+            
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                rows = list(reader)
+                headers = list(reader.fieldnames or [])
+            
+            row = dict(zip(
+                self._get_headers_from_context(context),
+                self._prepare_row_data(context, date_obj),
+            ))
+            
+            # Values are written under the CSV's own header; keys it does not
+            # have yet become new columns at the end
+            new_fields = [key for key in row if key not in headers]
+            if new_fields:
+                headers.extend(new_fields)
+                logger.info("Extended table header", new_fields=new_fields)
+            
+            # A re-run on the same day replaces that day's row
+            replaced = bool(rows) and rows[-1].get("Date") == row["Date"]
+            if replaced:
+                rows[-1] = row
+            else:
+                rows.append(row)
             
-            if latest_file and latest_file.name != filename:
-                # Copy the latest file to today's file
-                shutil.copy2(latest_file, filepath)
-                wb = load_workbook(filepath)
-                ws = wb.active
-                logger.info(
-                    "Copied existing XLSX file",
-                    source=str(latest_file),
-                    destination=str(filepath),
-                )
+            if new_fields or replaced:
+                self._write_table_csv(csv_path, headers, rows)
             else:
-                # Create new file with headers
-                headers = self._get_headers_from_context(context)
-                wb = self._create_initial_xlsx(headers)
-                ws = wb.active
+                with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+                    csv.DictWriter(f, fieldnames=headers, restval="").writerow(row)
             
-            # Add new row with today's data
-            row_data = self._prepare_row_data(context, date_obj)
-            ws.append(row_data)
+            # Rebuild today's workbook from the CSV rows instead of parsing
+            # the previous workbook
+            wb = self._create_initial_xlsx(headers)
+            ws = wb.active
+            for row in rows:
+                ws.append([row.get(header) or None for header in headers])
             
             # Save the workbook
             wb.save(filepath)
@@ -167,6 +257,47 @@ class FileWriter:
             )
             raise
     
+    def _seed_table_csv(self, csv_path: Path, context: Dict[str, Any]) -> None:
+        """Create the cumulative CSV from the latest XLSX table, if any.
+        
+        Args:
+            csv_path: Path of the CSV file to create
+            context: Dictionary of briefing data (used for headers when
+                there is no existing table)
+        """
+        latest_file = self._get_latest_xlsx_file()
+        
+        if latest_file:
+            wb = load_workbook(latest_file, read_only=True, data_only=True)
+            rows = [
+                ["" if value is None else value for value in row]
+                for row in wb.active.iter_rows(values_only=True)
+            ]
+            wb.close()
+            logger.info(
+                "Seeded table CSV from existing XLSX file",
+                source=str(latest_file),
+                rows=len(rows),
+            )
+        else:
+            rows = [self._get_headers_from_context(context)]
+        
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+    
+    def _write_table_csv(self, csv_path: Path, headers: List[str], rows: List[Dict[str, Any]]) -> None:
+        """Rewrite the cumulative CSV with the given header and rows.
+        
+        Args:
+            csv_path: Path of the CSV file
+            headers: Column headers, in order
+            rows: Rows keyed by header (missing columns are left blank)
+        """
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=headers, restval="", extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+    
     def _get_headers_from_context(self, context: Dict[str, Any]) -> List[str]:
         """Extract headers from context in template order.
         
@@ -176,57 +307,7 @@ class FileWriter:
         Returns:
             List of headers starting with Date
         """
-        # Define the expected order based on the template
-        ordered_fields = [
-            "Date",
-            "FULLDATE",
-            "YC_ARTICLE_PICK",
-            "YC_ARTICLE_SUMMARY",
-            "YC_ARTICLE_KEYPOINTS",
-            "YC_ARTICLE_KEYWORDS",
-            "GITHUB_TRENDING_MCP_NAME",
-            "GITHUB_TRENDING_MCP_SUMMARY",
-            "TRANSCRIPT_TABLE",
-            "COUNTRY_OF_THE_DAY",
-            "COUNTRY_CAPITAL_OF_THE_DAY",
-            "CAPITAL_LOCATION_BREAKDOWN",
-            "GET_TO_IT_SAYING",
-            "CODEBASE_TODAY",
-            "CODEBASE_SUMMARY",
-            "DAYS_LEFT",
-            "CURRENT_STUDY_YEAR",
-            "CURRENT_STUDY_STATE",
-            "CURRENT_YEAR_BEST_PICTURE",
-            "CURRENT_YEAR_BEST_ACTOR_IN_PICTURE",
-            "CURRENT_YEAR_BEST_CINEMATOGRAPHY",
-            "CURRENT_YEAR_BEST_SCORE",
-            "CURRENT_YEAR_BEST_FOREIGN_FILM",
-            "MAJOR_INVENTION_OF_YEAR",
-            "MAJOR_INVENTION_SUMMARY",
-            "CURRENT_GOLF_STATE_SUMMARY",
-            "CURRENT_YEAR_US_PRESIDENT_VPS",
-            "NEW_MAJOR_PRESIDENTIAL_DECISION",
-            "WW1_FACT",
-            "WW2_FACT",
-            "EUROPE_FACT",
-            "IRELAND_FACT",
-            "JERUSALEM_FACT",
-            "INDIA_FACT",
-            "MEXICO_FACT",
-            "STUNT_RIGGING_SUMMARY",
-            "BIKE_FUN_FACT",
-            "NASA_LAUNCH_HISTORY",
-            "TEACH_ME_GC",
-            "QUIZ_ME_CS_TERM",
-            "QUIZ_ME_ESPANOL",
-        ]
-        
-        # Add any additional fields from context that aren't in our list
-        for key in context.keys():
-            if key not in ordered_fields:
-                ordered_fields.append(key)
-                
-        return ordered_fields
+        return list(_headers_for_keys(tuple(context)))
     
     def _prepare_row_data(self, context: Dict[str, Any], date: datetime) -> List[Any]:
         """Prepare row data for XLSX in the correct order.
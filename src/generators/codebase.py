@@ -1,13 +1,15 @@
 """GitHub codebase selector and describer for odgsully repositories."""
-import json
 import random
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 import httpx
+import orjson
 
 from ..settings import settings
+from ..utils.files import atomic_write_json
 from ..utils.logger import get_logger
 from ..utils.retry import async_retry
 
@@ -15,9 +17,14 @@ logger = get_logger(__name__)
 
 GITHUB_API_BASE = "https://api.github.com"
 CODEBASE_HISTORY_FILE = "codebase_history.json"
+HISTORY_SIZE = 10
+RECENT_WINDOW = 2
 
+# Default generator for repository picks; callers can pass a seeded one
+_rng = random.Random()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Repository:
     """Represents a GitHub repository."""
     name: str
@@ -47,12 +54,20 @@ class CodebaseSelector:
         self.history_file = settings.root_dir / CODEBASE_HISTORY_FILE
         self.headers = {}
         
+        # Selection history, loaded on first use; selections are written back
+        # once, when the selector is closed or flush_history is called
+        self._history: Optional[List[str]] = None
+        self._history_dirty = False
+        
         if settings.github_token:
             self.headers["Authorization"] = f"token {settings.github_token}"
             
+        # HTTP/2 lets concurrent API requests share one connection
         self.client = httpx.AsyncClient(
             timeout=30.0,
-            headers=self.headers
+            headers=self.headers,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
         )
         
     async def __aenter__(self):
@@ -61,19 +76,29 @@ class CodebaseSelector:
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        self.flush_history()
         await self.client.aclose()
     
     def _load_history(self) -> List[str]:
         """Load codebase selection history.
         
+        Returns:
+            List of previously selected repository names
+        """
+        if self._history is None:
+            self._history = self._read_history()
+        return list(self._history)
+    
+    def _read_history(self) -> List[str]:
+        """Read codebase selection history from disk.
+        
         Returns:
             List of previously selected repository names
         """
         if self.history_file.exists():
             try:
-                with open(self.history_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get("history", [])
+                data = orjson.loads(self.history_file.read_bytes())
+                return data.get("history", [])
             except Exception as e:
                 logger.error(f"Failed to load history: {e}")
                 return []
@@ -85,12 +110,30 @@ class CodebaseSelector:
         Args:
             history: List of repository names
         """
+        self._history = list(history)
+        self._history_dirty = False
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump({"history": history}, f, indent=2)
+            atomic_write_json(self.history_file, {"history": history})
         except Exception as e:
             logger.error(f"Failed to save history: {e}")
     
+    def _record_selection(self, name: str) -> None:
+        """Append a selection to the in-memory history without writing it.
+        
+        Args:
+            name: Selected repository name
+        """
+        # Keep only the last HISTORY_SIZE selections
+        recent_history = deque(self._load_history(), maxlen=HISTORY_SIZE)
+        recent_history.append(name)
+        self._history = list(recent_history)
+        self._history_dirty = True
+    
+    def flush_history(self) -> None:
+        """Write pending selections to the history file, if there are any."""
+        if self._history_dirty:
+            self._save_history(self._history)
+    
     @async_retry(max_attempts=3, initial_delay=1.0)
     async def fetch_user_repos(self) -> List[Repository]:
         """Fetch all repositories for the user.
@@ -199,14 +242,16 @@ class CodebaseSelector:
             structure_lines.append("=" * 40)
             structure_lines.append("")
             
-            # Sort contents by type (dirs first) then name
-            contents.sort(key=lambda x: (x["type"] != "dir", x["name"]))
+            # Sort contents by type (dirs first) then name, computing the
+            # directory flag once per item rather than inside a key lambda
+            decorated = [(item["type"] != "dir", item["name"]) for item in contents]
+            decorated.sort()
             
-            for item in contents:
-                if item["type"] == "dir":
-                    structure_lines.append(f"📁 {item['name']}/")
+            for is_file, name in decorated:
+                if is_file:
+                    structure_lines.append(f"📄 {name}")
                 else:
-                    structure_lines.append(f"📄 {item['name']}")
+                    structure_lines.append(f"📁 {name}/")
             
             return "\n".join(structure_lines)
             
@@ -214,11 +259,31 @@ class CodebaseSelector:
             logger.error(f"Failed to fetch repo structure: {e}")
             return f"Repository: {repo.name}\n(Unable to fetch directory structure)"
     
-    def select_repository(self, repos: List[Repository]) -> Repository:
+    def _selection_candidates(
+        self, repos: List[Repository], history: List[str]
+    ) -> List[Repository]:
+        """Get the repositories eligible for the next selection.
+        
+        Args:
+            repos: List of available repositories
+            history: Previously selected repository names, oldest first
+            
+        Returns:
+            Repositories outside the recent window, or all of them if every
+            repository was picked recently
+        """
+        recent = set(history[-RECENT_WINDOW:])
+        available_repos = [r for r in repos if r.name not in recent]
+        return available_repos or list(repos)
+    
+    def select_repository(
+        self, repos: List[Repository], rng: Optional[random.Random] = None
+    ) -> Repository:
         """Select a repository avoiding recent repetitions.
         
         Args:
             repos: List of available repositories
+            rng: Random generator to pick with (defaults to a module-level one)
             
         Returns:
             Selected repository
@@ -233,22 +298,10 @@ class CodebaseSelector:
         if len(repos) == 1 or not history:
             selected = repos[0]
         else:
-            # Try to find a repo not in recent history
-            available_repos = [r for r in repos if r.name not in history[-2:]]
-            
-            # If all repos are recent, just use all repos
-            if not available_repos:
-                available_repos = repos
-            
-            # Select randomly from available
-            selected = random.choice(available_repos)
+            # Select uniformly at random from the repos not recently picked
+            selected = (rng or _rng).choice(self._selection_candidates(repos, history))
         
-        # Update history
-        history.append(selected.name)
-        # Keep only last 10 selections
-        if len(history) > 10:
-            history = history[-10:]
-        self._save_history(history)
+        self._record_selection(selected.name)
         
         logger.info(f"Selected repository: {selected.name}")
         return selected
@@ -1,17 +1,18 @@
 """Cycle engine for managing DaysLeft, Year, and State progression."""
 import json
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
 from ..settings import settings
+from ..utils.files import atomic_write_json
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 # US States in alphabetical order
-US_STATES = [
+US_STATES = (
     "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
     "Connecticut", "Delaware", "Florida", "Georgia", "Hawaii", "Idaho",
     "Illinois", "Indiana", "Iowa", "Kansas", "Kentucky", "Louisiana",
@@ -22,7 +23,10 @@ US_STATES = [
     "Pennsylvania", "Rhode Island", "South Carolina", "South Dakota",
     "Tennessee", "Texas", "Utah", "Vermont", "Virginia", "Washington",
     "West Virginia", "Wisconsin", "Wyoming"
-]
+)
+
+# State name to index lookup
+_STATE_INDEX = {name: i for i, name in enumerate(US_STATES)}
 
 
 @dataclass
@@ -36,7 +40,7 @@ class CycleState:
     @property
     def current_state(self) -> str:
         """Get the current US state name."""
-        return US_STATES[self.state_index % len(US_STATES)]
+        return US_STATES[self.state_index]
 
 
 class CycleEngine:
@@ -49,8 +53,21 @@ class CycleEngine:
             state_file: Name of the JSON file to store state
         """
         self.state_file = settings.root_dir / state_file
+        # Cached (last_updated, parsed date) pair to avoid re-parsing
+        self._last_date_cache: Optional[Tuple[str, date]] = None
         self.state = self._load_state()
         
+    def _last_updated_date(self) -> date:
+        """Get the date of the last update, parsing only when it changes.
+        
+        Returns:
+            Date portion of state.last_updated
+        """
+        last_updated = self.state.last_updated
+        if self._last_date_cache is None or self._last_date_cache[0] != last_updated:
+            self._last_date_cache = (last_updated, datetime.fromisoformat(last_updated).date())
+        return self._last_date_cache[1]
+        
     def _load_state(self) -> CycleState:
         """Load state from JSON file or create initial state.
         
@@ -63,6 +80,15 @@ class CycleEngine:
                     data = json.load(f)
                     
                 state = CycleState(**data)
+                if not 0 <= state.state_index < len(US_STATES):
+                    # Wrap a hand-edited or legacy index rather than
+                    # discarding the saved progress
+                    logger.warning(
+                        "Cycle state index out of range, wrapping",
+                        state_index=state.state_index,
+                    )
+                    state.state_index %= len(US_STATES)
+                
                 logger.info(
                     "Loaded cycle state",
                     year=state.year,
@@ -94,8 +120,7 @@ class CycleEngine:
             state: Cycle state to save
         """
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(asdict(state), f, indent=2)
+            atomic_write_json(self.state_file, asdict(state))
                 
             logger.info("Saved cycle state")
             
@@ -103,15 +128,19 @@ class CycleEngine:
             logger.error(f"Failed to save cycle state: {e}")
             raise
     
-    def advance(self) -> Tuple[int, str, int]:
+    def advance(self, persist: bool = True) -> Tuple[int, str, int]:
         """Advance the cycle by one day.
         
+        Args:
+            persist: Whether to save the advanced state to disk
+            
         Returns:
             Tuple of (current_year, current_state, days_left)
         """
         # Check if we need to advance (different day)
-        last_date = datetime.fromisoformat(self.state.last_updated).date()
-        current_date = datetime.now().date()
+        now = datetime.now()
+        current_date = now.date()
+        last_date = self._last_updated_date()
         
         if last_date >= current_date:
             # Same day, return current values
@@ -141,10 +170,12 @@ class CycleEngine:
             )
         
         # Update timestamp
-        self.state.last_updated = datetime.now().isoformat()
+        self.state.last_updated = now.isoformat()
+        self._last_date_cache = (self.state.last_updated, current_date)
         
         # Save state
-        self._save_state(self.state)
+        if persist:
+            self._save_state(self.state)
         
         return self.state.year, self.state.current_state, self.state.days_left
     
@@ -156,14 +187,29 @@ class CycleEngine:
         """
         return self.state.year, self.state.current_state, self.state.days_left
     
-    def reset(self, year: int = 1980, state_index: int = 0, days_left: int = 3) -> None:
+    def reset(
+        self,
+        year: int = 1980,
+        state_index: Union[int, str] = 0,
+        days_left: int = 3,
+    ) -> None:
         """Reset the cycle to specific values.
         
         Args:
             year: Starting year
-            state_index: Starting state index
+            state_index: Starting state index or US state name
             days_left: Starting days left
+            
+        Raises:
+            ValueError: If state_index is an unknown state name
         """
+        if isinstance(state_index, str):
+            if state_index not in _STATE_INDEX:
+                raise ValueError(f"Unknown US state: {state_index}")
+            state_index = _STATE_INDEX[state_index]
+        else:
+            state_index %= len(US_STATES)
+        
         self.state = CycleState(
             year=year,
             state_index=state_index,
@@ -204,7 +250,8 @@ class CycleEngine:
             yesterday = yesterday.replace(day=yesterday.day - 1)
             self.state.last_updated = yesterday.isoformat()
             
-            year, state, days = self.advance()
+            # Intermediate states are discarded, so skip saving them
+            year, state, days = self.advance(persist=False)
             results.append((year, state, days))
         
         # Restore original state
@@ -1,5 +1,10 @@
 """OpenAI GPT wrapper for content summarization."""
-from typing import Dict, List, Optional
+import asyncio
+import functools
+import json
+import math
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 
 import openai
 from openai import AsyncOpenAI
@@ -7,6 +12,7 @@ from openai import AsyncOpenAI
 from ..settings import settings
 from ..utils.logger import get_logger
 from ..utils.retry import async_retry
+from ..utils.summary_cache import SummaryCache, make_cache_key
 
 logger = get_logger(__name__)
 
@@ -15,13 +21,100 @@ DEFAULT_WORD_LIMIT = 200
 SUMMARY_WORD_LIMIT = 150
 KEYPOINTS_WORD_LIMIT = 100
 
+SUMMARY_CACHE_FILE = "summary_cache.db"
+
+# Summaries of fixed reference data (e.g. Oscar winners) never go stale, while
+# facts are keyed by calendar date so each day's briefing gets new ones (the
+# TTL only bounds how long an entry is kept)
+PERMANENT_PROMPT_TYPES = {"movie_summary", "score_summary"}
+FACT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# System prompts are module constants so every request of a kind starts
+# with the same text, which keeps it eligible for provider prefix caching
+SUMMARY_SYSTEM_PROMPT = "You are a concise and accurate summarizer."
+FACT_SYSTEM_PROMPT = "You are a knowledgeable educator who provides interesting facts."
+
+# Prompt templates, formatted on demand so only the selected one is built
+PROMPT_TEMPLATES = {
+    "summary": "Summarize the following content in {word_limit} words or less:\n\n{content}",
+    
+    "keypoints": "Extract the key facts and points from the following content as a bulleted list. Limit to {word_limit} words total:\n\n{content}",
+    
+    "keywords": "List all relevant keywords and tags from the following content. Format as comma-separated values:\n\n{content}",
+    
+    "mcp_summary": "Summarize this GitHub Model Context Protocol (MCP) repository in {word_limit} words or less. Focus on its purpose, features, and use cases:\n\n{content}",
+    
+    "codebase_summary": "Provide a comprehensive summary of this codebase in {word_limit} words or less. Include the main directories, purpose, and key features:\n\n{content}",
+    
+    "fact": "Generate an interesting and educational fact about {content}. Limit to {word_limit} words.",
+    
+    "golf_summary": "Describe the most renowned golf courses/clubs in {content}. Include details about their location relative to major cities or landmarks using driving distances and directions (N/S/E/W). Limit to {word_limit} words.",
+    
+    "invention_summary": "Provide a summary/history of {content}. Limit to {word_limit} words.",
+    
+    "gc_knowledge": "Write a 2-paragraph excerpt about {content} that would be standard knowledge for general contractors working on commercial and residential developments. Make it practical and informative.",
+    
+    "movie_summary": "Provide a brief {word_limit} word summary of the plot of {content}. Focus on the main storyline and key themes.",
+    
+    "score_summary": "Provide a brief {word_limit} word summary about the musical score of {content}. Include the composer name if known.",
+}
+
+FACT_PROMPT_TEMPLATES = {
+    "ww1": "Generate an interesting and lesser-known fact about World War 1. Limit to {word_limit} words.",
+    
+    "ww2": "Generate an interesting and lesser-known fact about World War 2. Limit to {word_limit} words.",
+    
+    "europe": "Generate an interesting historical fact about Europe. Limit to {word_limit} words.",
+    
+    "ireland": "Generate an interesting historical fact about Ireland. Limit to {word_limit} words.",
+    
+    "jerusalem": "Generate an interesting historical fact about Jerusalem. Limit to {word_limit} words.",
+    
+    "india": "Generate an interesting historical fact about India. Limit to {word_limit} words.",
+    
+    "mexico": "Generate an interesting historical fact about Mexico. Limit to {word_limit} words.",
+    
+    "stunt_rigging": "Generate an interesting fact or summary about stunt rigging in film/TV production. Limit to {word_limit} words.",
+    
+    "bike": "Generate an interesting fact about dirt bikes or street motorcycles history. Limit to {word_limit} words.",
+    
+    "nasa_launch": "Generate a fact about a NASA launch that occurred in the year {topic}. If no launches that year, mention the closest significant launch. Limit to {word_limit} words.",
+    
+    "gc": "Generate practical general contractor knowledge about a random aspect of commercial or residential development. Make it a 2-paragraph excerpt with useful information.",
+}
+
+DEFAULT_FACT_PROMPT_TEMPLATE = "Generate an interesting fact about {topic}. Limit to {word_limit} words."
+
+
+# Templates are split around their content slot and given their word limit
+# once per (type, limit), so building a prompt is a cache hit and a concat
+@functools.lru_cache(maxsize=64)
+def _prompt_parts(prompt_type: str, word_limit: int) -> Tuple[str, str]:
+    """Get the text before and after the content slot of a prompt template.
+    
+    Args:
+        prompt_type: Type of processing needed
+        word_limit: Word limit for response
+        
+    Returns:
+        Tuple of (prefix, suffix) with the word limit filled in
+    """
+    template = PROMPT_TEMPLATES.get(prompt_type, PROMPT_TEMPLATES["summary"])
+    prefix, _, suffix = template.partition("{content}")
+    return prefix.format(word_limit=word_limit), suffix.format(word_limit=word_limit)
+
 
 class Summarizer:
     """Handles content summarization using OpenAI GPT."""
     
-    def __init__(self):
-        """Initialize the summarizer with OpenAI client."""
+    def __init__(self, cache: Optional[SummaryCache] = None):
+        """Initialize the summarizer with OpenAI client.
+        
+        Args:
+            cache: Summary cache to use (defaults to one under cache_dir)
+        """
         self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.cache = cache or SummaryCache(settings.cache_dir / SUMMARY_CACHE_FILE)
         
     @async_retry(max_attempts=3, initial_delay=1.0)
     async def summarize(
@@ -45,21 +138,40 @@ class Summarizer:
         if not content:
             return "(No content to summarize)"
         
+        cache_key = make_cache_key(content, prompt_type, word_limit, additional_context)
+        cached = self.cache.get(cache_key, self._cache_ttl(prompt_type))
+        if cached is not None:
+            logger.info("Summary cache hit", prompt_type=prompt_type)
+            return cached
+        
         # Build the appropriate prompt
         prompt = self._build_prompt(content, prompt_type, word_limit, additional_context)
         
         try:
-            response = await self.client.chat.completions.create(
+            stream = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are a concise and accurate summarizer."},
+                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
-                max_tokens=word_limit * 2,  # Rough estimate
+                max_completion_tokens=word_limit * 2,  # Rough estimate
+                stream=True,
             )
             
-            result = response.choices[0].message.content.strip()
+            # max_completion_tokens bounds the length, so the stream is read to
+            # the end and only complete summaries are cached
+            parts = []
+            async with stream:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    parts.append(delta)
+            
+            result = "".join(parts).strip()
             
             logger.info(
                 "Generated summary",
@@ -68,12 +180,26 @@ class Summarizer:
                 output_length=len(result),
             )
             
+            self.cache.set(cache_key, result)
             return result
             
         except Exception as e:
             logger.error(f"Failed to generate summary: {e}")
             return f"(Summary generation failed: {str(e)})"
     
+    def _cache_ttl(self, prompt_type: str) -> Optional[float]:
+        """Get the cache TTL for a summary prompt type.
+        
+        Args:
+            prompt_type: Type of summary
+            
+        Returns:
+            TTL in seconds, or None for the cache default
+        """
+        if prompt_type in PERMANENT_PROMPT_TYPES:
+            return math.inf
+        return None
+    
     def _build_prompt(
         self,
         content: str,
@@ -83,6 +209,9 @@ class Summarizer:
     ) -> str:
         """Build the appropriate prompt based on type.
         
+        The per-type instructions always lead the prompt and any additional
+        context follows, so prompts of one type share a common prefix.
+        
         Args:
             content: Content to process
             prompt_type: Type of processing needed
@@ -92,37 +221,41 @@ class Summarizer:
         Returns:
             Formatted prompt
         """
-        base_prompts = {
-            "summary": f"Summarize the following content in {word_limit} words or less:\n\n{content}",
-            
-            "keypoints": f"Extract the key facts and points from the following content as a bulleted list. Limit to {word_limit} words total:\n\n{content}",
-            
-            "keywords": f"List all relevant keywords and tags from the following content. Format as comma-separated values:\n\n{content}",
-            
-            "mcp_summary": f"Summarize this GitHub Model Context Protocol (MCP) repository in {word_limit} words or less. Focus on its purpose, features, and use cases:\n\n{content}",
-            
-            "codebase_summary": f"Provide a comprehensive summary of this codebase in {word_limit} words or less. Include the main directories, purpose, and key features:\n\n{content}",
-            
-            "fact": f"Generate an interesting and educational fact about {content}. Limit to {word_limit} words.",
-            
-            "golf_summary": f"Describe the most renowned golf courses/clubs in {content}. Include details about their location relative to major cities or landmarks using driving distances and directions (N/S/E/W). Limit to {word_limit} words.",
-            
-            "invention_summary": f"Provide a summary/history of {content}. Limit to {word_limit} words.",
-            
-            "gc_knowledge": f"Write a 2-paragraph excerpt about {content} that would be standard knowledge for general contractors working on commercial and residential developments. Make it practical and informative.",
-            
-            "movie_summary": f"Provide a brief {word_limit} word summary of the plot of {content}. Focus on the main storyline and key themes.",
-            
-            "score_summary": f"Provide a brief {word_limit} word summary about the musical score of {content}. Include the composer name if known.",
-        }
-        
-        prompt = base_prompts.get(prompt_type, base_prompts["summary"])
+        prefix, suffix = _prompt_parts(prompt_type, word_limit)
+        prompt = prefix + content + suffix
         
         if additional_context:
-            prompt = f"{additional_context}\n\n{prompt}"
+            prompt = f"{prompt}\n\nAdditional context:\n{additional_context}"
             
         return prompt
     
+    def _fact_cache_key(self, topic: str, fact_type: str, word_limit: int) -> str:
+        """Build the cache key for a fact, scoped to today's date.
+        
+        Args:
+            topic: Topic of the fact
+            fact_type: Type of fact
+            word_limit: Maximum words
+            
+        Returns:
+            Cache key that changes at midnight
+        """
+        return make_cache_key(topic, f"fact:{fact_type}", word_limit, date.today().isoformat())
+    
+    def _build_fact_prompt(self, topic: str, fact_type: str, word_limit: int) -> str:
+        """Build the prompt for a fact type.
+        
+        Args:
+            topic: Topic to generate fact about
+            fact_type: Type of fact
+            word_limit: Maximum words
+            
+        Returns:
+            Formatted prompt
+        """
+        template = FACT_PROMPT_TEMPLATES.get(fact_type, DEFAULT_FACT_PROMPT_TEMPLATE)
+        return template.format(topic=topic, word_limit=word_limit)
+    
     async def generate_fact(
         self,
         topic: str,
@@ -139,41 +272,23 @@ class Summarizer:
         Returns:
             Generated fact
         """
-        prompts = {
-            "ww1": f"Generate an interesting and lesser-known fact about World War 1. Limit to {word_limit} words.",
-            
-            "ww2": f"Generate an interesting and lesser-known fact about World War 2. Limit to {word_limit} words.",
-            
-            "europe": f"Generate an interesting historical fact about Europe. Limit to {word_limit} words.",
-            
-            "ireland": f"Generate an interesting historical fact about Ireland. Limit to {word_limit} words.",
-            
-            "jerusalem": f"Generate an interesting historical fact about Jerusalem. Limit to {word_limit} words.",
-            
-            "india": f"Generate an interesting historical fact about India. Limit to {word_limit} words.",
-            
-            "mexico": f"Generate an interesting historical fact about Mexico. Limit to {word_limit} words.",
-            
-            "stunt_rigging": f"Generate an interesting fact or summary about stunt rigging in film/TV production. Limit to {word_limit} words.",
-            
-            "bike": f"Generate an interesting fact about dirt bikes or street motorcycles history. Limit to {word_limit} words.",
-            
-            "nasa_launch": f"Generate a fact about a NASA launch that occurred in the year {topic}. If no launches that year, mention the closest significant launch. Limit to {word_limit} words.",
-            
-            "gc": f"Generate practical general contractor knowledge about a random aspect of commercial or residential development. Make it a 2-paragraph excerpt with useful information.",
-        }
+        cache_key = self._fact_cache_key(topic, fact_type, word_limit)
+        cached = self.cache.get(cache_key, FACT_CACHE_TTL_SECONDS)
+        if cached is not None:
+            logger.info("Fact cache hit", fact_type=fact_type)
+            return cached
         
-        prompt = prompts.get(fact_type, f"Generate an interesting fact about {topic}. Limit to {word_limit} words.")
+        prompt = self._build_fact_prompt(topic, fact_type, word_limit)
         
         try:
             response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
-                    {"role": "system", "content": "You are a knowledgeable educator who provides interesting facts."},
+                    {"role": "system", "content": FACT_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
-                max_tokens=word_limit * 2,
+                max_completion_tokens=word_limit * 2,
             )
             
             result = response.choices[0].message.content.strip()
@@ -185,6 +300,7 @@ class Summarizer:
                 output_length=len(result),
             )
             
+            self.cache.set(cache_key, result)
             return result
             
         except Exception as e:
@@ -206,6 +322,9 @@ class Summarizer:
             Dict mapping keys to summaries
         """
         results = {}
+        # Items with identical content and type share one summary, even when
+        # it failed and so was never written to the cache
+        summaries: Dict[Tuple[str, str], str] = {}
         
         for item in items:
             key = item.get("key", "")
@@ -213,7 +332,126 @@ class Summarizer:
             prompt_type = item.get("type", "summary")
             
             if key and content:
-                summary = await self.summarize(content, prompt_type, word_limit)
-                results[key] = summary
+                request = (content, prompt_type)
+                if request not in summaries:
+                    summaries[request] = await self.summarize(content, prompt_type, word_limit)
+                results[key] = summaries[request]
                 
-        return results
\ No newline at end of file
+        return results
+    
+    async def batch_generate(self, specs: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Generate several facts and summaries with a single JSON completion.
+        
+        Specs whose type is a fact type are generated like generate_fact,
+        the rest like summarize. Any key missing from the JSON response (or
+        every key, if the response cannot be parsed) falls back to its own
+        request.
+        
+        Args:
+            specs: List of dicts with 'key', 'type', 'content' and 'word_limit'
+            
+        Returns:
+            Dict mapping keys to generated text (failed keys are omitted)
+        """
+        results: Dict[str, str] = {}
+        
+        # Serve what we can from the cache and only request the rest
+        pending = []
+        for spec in specs:
+            cache_key, ttl_seconds = self._spec_cache_entry(spec)
+            cached = self.cache.get(cache_key, ttl_seconds)
+            if cached is not None:
+                results[spec["key"]] = cached
+            else:
+                pending.append(spec)
+        
+        if not pending:
+            return results
+        
+        lines = [
+            "Respond with a single JSON object containing exactly these string fields.",
+            "Each field must follow its instructions:",
+            "",
+        ]
+        total_words = 0
+        for spec in pending:
+            word_limit = spec.get("word_limit", DEFAULT_WORD_LIMIT)
+            total_words += word_limit
+            instruction = self._build_spec_prompt(spec).replace("\n", " ")
+            lines.append(f"- {spec['key']}: {instruction}")
+        
+        try:
+            response = await self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": FACT_SYSTEM_PROMPT},
+                    {"role": "user", "content": "\n".join(lines)}
+                ],
+                temperature=0.7,
+                max_completion_tokens=total_words * 2 + 20 * len(pending),
+                response_format={"type": "json_object"},
+            )
+            
+            data = json.loads(response.choices[0].message.content)
+            generated = 0
+            for spec in pending:
+                value = data.get(spec["key"])
+                if isinstance(value, str) and value.strip():
+                    results[spec["key"]] = value.strip()
+                    self.cache.set(self._spec_cache_entry(spec)[0], results[spec["key"]])
+                    generated += 1
+            
+            logger.info(
+                "Generated batch",
+                requested=len(pending),
+                generated=generated,
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to generate batch: {e}")
+        
+        missing = [spec for spec in pending if spec["key"] not in results]
+        if missing:
+            logger.warning(
+                "Falling back to individual requests",
+                keys=[spec["key"] for spec in missing],
+            )
+            fallback = await asyncio.gather(
+                *(self._generate_spec(spec) for spec in missing),
+                return_exceptions=True,
+            )
+            for spec, value in zip(missing, fallback):
+                if not isinstance(value, Exception):
+                    results[spec["key"]] = value
+        
+        return results
+    
+    def _spec_cache_entry(self, spec: Dict[str, Any]) -> Tuple[str, Optional[float]]:
+        """Get the cache key and TTL shared with generate_fact/summarize."""
+        content = spec.get("content", "")
+        prompt_type = spec.get("type", "summary")
+        word_limit = spec.get("word_limit", DEFAULT_WORD_LIMIT)
+        
+        if prompt_type in FACT_PROMPT_TEMPLATES:
+            return self._fact_cache_key(content, prompt_type, word_limit), FACT_CACHE_TTL_SECONDS
+        return make_cache_key(content, prompt_type, word_limit), self._cache_ttl(prompt_type)
+    
+    def _build_spec_prompt(self, spec: Dict[str, Any]) -> str:
+        """Build the prompt for a batch_generate spec."""
+        content = spec.get("content", "")
+        prompt_type = spec.get("type", "summary")
+        word_limit = spec.get("word_limit", DEFAULT_WORD_LIMIT)
+        
+        if prompt_type in FACT_PROMPT_TEMPLATES:
+            return self._build_fact_prompt(content, prompt_type, word_limit)
+        return self._build_prompt(content, prompt_type, word_limit, None)
+    
+    async def _generate_spec(self, spec: Dict[str, Any]) -> str:
+        """Generate a single batch_generate spec with its own request."""
+        content = spec.get("content", "")
+        prompt_type = spec.get("type", "summary")
+        word_limit = spec.get("word_limit", DEFAULT_WORD_LIMIT)
+        
+        if prompt_type in FACT_PROMPT_TEMPLATES:
+            return await self.generate_fact(content, prompt_type, word_limit)
+        return await self.summarize(content, prompt_type, word_limit)
@@ -2,13 +2,15 @@
 """Main orchestrator for Jarvis BriefMe daily briefing generation."""
 import argparse
 import asyncio
-import random
+import csv
+import functools
 import sys
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
-import pandas as pd
+import httpx
 
 from .emailer import Emailer
 from .fetchers.hn import HackerNewsFetcher
@@ -21,7 +23,7 @@ from .generators.cycle import CycleEngine
 from .generators.codebase import CodebaseSelector
 from .generators.summariser import Summarizer
 from .settings import settings
-from .template_engine import TemplateEngine
+from .template_engine import TemplateEngine, get_to_it_phrase
 from .utils.logger import configure_logging, get_logger
 
 logger = get_logger(__name__)
@@ -29,6 +31,147 @@ logger = get_logger(__name__)
 # Configure logging
 configure_logging()
 
+# Context keys filled from the Oscars dataset
+OSCAR_KEYS = (
+    "CURRENT_YEAR_BEST_PICTURE",
+    "CURRENT_YEAR_BEST_ACTOR_IN_PICTURE",
+    "CURRENT_YEAR_BEST_CINEMATOGRAPHY",
+    "CURRENT_YEAR_BEST_SCORE",
+    "CURRENT_YEAR_BEST_FOREIGN_FILM",
+    "CURRENT_YEAR_BEST_PICTURE_SUM",
+    "CURRENT_YEAR_BEST_ACTOR_IN_PICTURE_SUM",
+    "CURRENT_YEAR_BEST_CINEMATOGRAPHY_SUM",
+    "CURRENT_YEAR_BEST_SCORE_SUM",
+    "CURRENT_YEAR_BEST_FOREIGN_FILM_SUM",
+)
+
+# Context keys filled by _gather_year_based_data
+YEAR_BASED_KEYS = OSCAR_KEYS + (
+    "CURRENT_YEAR_US_PRESIDENT_VPS",
+    "NEW_MAJOR_PRESIDENTIAL_DECISION",
+    "MAJOR_INVENTION_OF_YEAR",
+    "MAJOR_INVENTION_SUMMARY",
+)
+
+# Context keys filled by _gather_generated_facts
+GENERATED_FACT_KEYS = (
+    "WW1_FACT",
+    "WW2_FACT",
+    "EUROPE_FACT",
+    "IRELAND_FACT",
+    "JERUSALEM_FACT",
+    "INDIA_FACT",
+    "MEXICO_FACT",
+    "STUNT_RIGGING_SUMMARY",
+    "BIKE_FUN_FACT",
+    "NASA_LAUNCH_HISTORY",
+    "TEACH_ME_GC",
+    "CURRENT_GOLF_STATE_SUMMARY",
+    "CODEBASE_TODAY",
+    "CODEBASE_SUMMARY",
+)
+
+# Every context key the daily template uses; gather_data starts from these
+# so failed gatherers leave "(data unavailable)" in place
+ALL_TEMPLATE_KEYS = (
+    "FULLDATE",
+    "CURRENT_STUDY_YEAR",
+    "CURRENT_STUDY_STATE",
+    "DAYS_LEFT",
+    "GET_TO_IT_SAYING",
+    "YC_ARTICLE_PICK",
+    "YC_ARTICLE_SUMMARY",
+    "YC_ARTICLE_KEYPOINTS",
+    "YC_ARTICLE_KEYWORDS",
+    "GITHUB_TRENDING_MCP_NAME",
+    "GITHUB_TRENDING_MCP_SUMMARY",
+    "TRANSCRIPT_TABLE",
+    "QUIZ_ME_CS_TERM",
+    "QUIZ_ME_CS_DEFINE",
+    "QUIZ_ME_ESPANOL",
+    "QuizMeIngles",
+    "COUNTRY_OF_THE_DAY",
+    "COUNTRY_CAPITAL_OF_THE_DAY",
+    "CAPITAL_LOCATION_BREAKDOWN",
+) + YEAR_BASED_KEYS + GENERATED_FACT_KEYS + (
+    "DAILY_LANGUAGE_SECTION",
+)
+
+# (context key, fact type, word limit) for each generated fact, with word
+# limits from define_fields.txt
+FACT_SPECS = (
+    ("WW1_FACT", "ww1", 50),
+    ("WW2_FACT", "ww2", 50),
+    ("EUROPE_FACT", "europe", 50),
+    ("IRELAND_FACT", "ireland", 50),
+    ("JERUSALEM_FACT", "jerusalem", 50),
+    ("INDIA_FACT", "india", 50),
+    ("MEXICO_FACT", "mexico", 50),
+    ("STUNT_RIGGING_SUMMARY", "stunt_rigging", 50),
+    ("BIKE_FUN_FACT", "bike", 100),
+    ("NASA_LAUNCH_HISTORY", "nasa_launch", 100),
+    ("TEACH_ME_GC", "gc", 100),
+    ("CURRENT_GOLF_STATE_SUMMARY", "golf_summary", 150),
+)
+
+# Placeholders written when a source responds but has nothing for today
+_HN_FALLBACKS = MappingProxyType({
+    'YC_ARTICLE_PICK': "(No article available)",
+    'YC_ARTICLE_SUMMARY': "(Summary not available)",
+    'YC_ARTICLE_KEYPOINTS': "(Key points not available)",
+    'YC_ARTICLE_KEYWORDS': "(Keywords not available)",
+})
+_GH_FALLBACKS = MappingProxyType({
+    'GITHUB_TRENDING_MCP_NAME': "(No MCP repo found)",
+    'GITHUB_TRENDING_MCP_SUMMARY': "(No MCP summary available)",
+})
+_SHEETS_FALLBACKS = MappingProxyType({
+    'TRANSCRIPT_TABLE': "Google Sheets connection failed",
+    'QUIZ_ME_CS_TERM': "CS quiz not available",
+    'QUIZ_ME_ESPANOL': "Spanish quiz not available",
+})
+_COUNTRY_FALLBACKS = MappingProxyType({
+    'COUNTRY_OF_THE_DAY': "(Country not available)",
+    'COUNTRY_CAPITAL_OF_THE_DAY': "(Capital not available)",
+    'CAPITAL_LOCATION_BREAKDOWN': "(Location not available)",
+})
+_CODEBASE_FALLBACKS = MappingProxyType({
+    'CODEBASE_TODAY': "(Codebase not available)",
+    'CODEBASE_SUMMARY': "(Summary not available)",
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _load_year_table(path: Path) -> Dict[int, Dict[str, Any]]:
+    """Load a year-based dataset once and index its rows by year.
+    
+    Args:
+        path: Path to a CSV file with a Year column
+        
+    Returns:
+        Dictionary mapping year to the first row for that year
+    """
+    table: Dict[int, Dict[str, Any]] = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            table.setdefault(int(row['Year']), row)
+    return table
+
+
+def _load_year_tables(datasets_dir: Path) -> Tuple[Dict[int, Dict[str, Any]], ...]:
+    """Load the Oscars, Presidents and Inventions year tables.
+    
+    Args:
+        datasets_dir: Directory containing the dataset CSVs
+        
+    Returns:
+        Tuple of (oscars, presidents, inventions) year tables
+    """
+    return tuple(
+        _load_year_table(datasets_dir / filename)
+        for filename in ("Oscars.csv", "Presidents.csv", "Inventions.csv")
+    )
+
 
 class BriefingOrchestrator:
     """Main orchestrator for daily briefing generation."""
@@ -41,21 +184,39 @@ class BriefingOrchestrator:
         self.cycle_engine = CycleEngine()
         self.summarizer = Summarizer()
         self.language_fetcher = LanguageFetcher()
+        self._date_cache: Optional[Tuple[date, str, int]] = None
         
         # Ensure directories exist
         settings.ensure_directories()
         
+    def _date_context(self) -> Tuple[str, int]:
+        """Get today's formatted date and day of year.
+        
+        The values are derived once per calendar day, so repeated runs in
+        one process (retries, tests) reuse them.
+        
+        Returns:
+            Tuple of (full date string, day of year)
+        """
+        today = date.today()
+        if self._date_cache is None or self._date_cache[0] != today:
+            self._date_cache = (
+                today,
+                today.strftime("%A, %B %d, %Y"),
+                today.timetuple().tm_yday,
+            )
+        return self._date_cache[1], self._date_cache[2]
+    
     async def gather_data(self) -> Dict[str, str]:
         """Gather all data for the daily briefing.
         
         Returns:
             Dictionary of all template context data
         """
-        context = {}
+        context = dict.fromkeys(ALL_TEMPLATE_KEYS, "(data unavailable)")
         
         # Get current date
-        now = datetime.now()
-        context['FULLDATE'] = now.strftime("%A, %B %d, %Y")
+        context['FULLDATE'], day_of_year = self._date_context()
         
         # Get cycle data
         year, state, days_left = self.cycle_engine.advance()
@@ -63,24 +224,39 @@ class BriefingOrchestrator:
         context['CURRENT_STUDY_STATE'] = state
         context['DAYS_LEFT'] = str(days_left)
         
-        # Add catchphrase
-        context['GET_TO_IT_SAYING'] = "dive into"
+        # Add catchphrase, rotated deterministically by date
+        context['GET_TO_IT_SAYING'] = get_to_it_phrase(context['FULLDATE'])
+        
+        # Gather data from the independent sources concurrently; each
+        # gatherer writes its own disjoint set of context keys. The public
+        # web fetchers share one connection pool for the whole run.
+        async with httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        ) as http_client:
+            results = await asyncio.gather(
+                self._gather_hacker_news(context, http_client),
+                self._gather_github_trending(context, http_client),
+                self._gather_sheets_data(context, http_client),
+                self._gather_country_data(context),
+                self._gather_year_based_data(context, year),
+                self._gather_generated_facts(context, year, state),
+                asyncio.to_thread(self._gather_language_section, context, day_of_year),
+                return_exceptions=True,
+            )
         
-        # Gather data from various sources
-        await self._gather_hacker_news(context)
-        await self._gather_github_trending(context)
-        await self._gather_sheets_data(context)
-        await self._gather_country_data(context)
-        await self._gather_year_based_data(context, year)
-        await self._gather_generated_facts(context, year, state)
-        self._gather_language_section(context, now)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Data gatherer failed: {result}")
         
         return context
     
-    async def _gather_hacker_news(self, context: Dict[str, str]) -> None:
+    async def _gather_hacker_news(
+        self, context: Dict[str, str], http_client: Optional[httpx.AsyncClient] = None
+    ) -> None:
         """Gather Hacker News data."""
         try:
-            async with HackerNewsFetcher() as hn_fetcher:
+            async with HackerNewsFetcher(client=http_client) as hn_fetcher:
                 result = await hn_fetcher.get_top_article()
                 
                 if result:
@@ -96,22 +272,17 @@ class BriefingOrchestrator:
                         article.title, "keypoints", 100
                     )
                 else:
-                    context['YC_ARTICLE_PICK'] = "(No article available)"
-                    context['YC_ARTICLE_SUMMARY'] = "(Summary not available)"
-                    context['YC_ARTICLE_KEYPOINTS'] = "(Key points not available)"
-                    context['YC_ARTICLE_KEYWORDS'] = "(Keywords not available)"
+                    context.update(_HN_FALLBACKS)
                     
         except Exception as e:
             logger.error(f"Failed to gather Hacker News data: {e}")
-            context['YC_ARTICLE_PICK'] = "(data unavailable)"
-            context['YC_ARTICLE_SUMMARY'] = "(data unavailable)"
-            context['YC_ARTICLE_KEYPOINTS'] = "(data unavailable)"
-            context['YC_ARTICLE_KEYWORDS'] = "(data unavailable)"
     
-    async def _gather_github_trending(self, context: Dict[str, str]) -> None:
+    async def _gather_github_trending(
+        self, context: Dict[str, str], http_client: Optional[httpx.AsyncClient] = None
+    ) -> None:
         """Gather GitHub trending MCP data."""
         try:
-            async with GitHubTrendingFetcher() as gh_fetcher:
+            async with GitHubTrendingFetcher(client=http_client) as gh_fetcher:
                 mcp_repo = await gh_fetcher.get_top_mcp_repo()
                 
                 if mcp_repo:
@@ -120,25 +291,22 @@ class BriefingOrchestrator:
                         mcp_repo.description, "mcp_summary", 150
                     )
                 else:
-                    context['GITHUB_TRENDING_MCP_NAME'] = "(No MCP repo found)"
-                    context['GITHUB_TRENDING_MCP_SUMMARY'] = "(No MCP summary available)"
+                    context.update(_GH_FALLBACKS)
                     
         except Exception as e:
             logger.error(f"Failed to gather GitHub trending data: {e}")
-            context['GITHUB_TRENDING_MCP_NAME'] = "(data unavailable)"
-            context['GITHUB_TRENDING_MCP_SUMMARY'] = "(data unavailable)"
     
-    async def _gather_sheets_data(self, context: Dict[str, str]) -> None:
+    async def _gather_sheets_data(
+        self, context: Dict[str, str], http_client: Optional[httpx.AsyncClient] = None
+    ) -> None:
         """Gather Google Sheets data for transcripts and quizzes."""
         try:
-            async with GoogleSheetsFetcher() as sheets_fetcher:
+            async with GoogleSheetsFetcher(http_client=http_client) as sheets_fetcher:
                 # Test connection first
                 connection_working = await sheets_fetcher.test_connection()
                 if not connection_working:
                     logger.error("Google Sheets connection failed, skipping all sheets data")
-                    context['TRANSCRIPT_TABLE'] = "Google Sheets connection failed"
-                    context['QUIZ_ME_CS_TERM'] = "CS quiz not available"
-                    context['QUIZ_ME_ESPANOL'] = "Spanish quiz not available"
+                    context.update(_SHEETS_FALLBACKS)
                     return
                 
                 # Get transcripts with analysis
@@ -159,9 +327,8 @@ class BriefingOrchestrator:
                     context['TRANSCRIPT_TABLE'] = "No transcripts available for analysis"
                 
                 # Get CS quiz
-                cs_terms = await sheets_fetcher.fetch_all_cs_terms()
-                if cs_terms:
-                    term = random.choice(cs_terms)
+                term = await sheets_fetcher.fetch_random_cs_term()
+                if term:
                     context['QUIZ_ME_CS_TERM'] = term.term
                     context['QUIZ_ME_CS_DEFINE'] = term.definition
                 else:
@@ -169,9 +336,8 @@ class BriefingOrchestrator:
                     context['QUIZ_ME_CS_DEFINE'] = "Definition not available"
                 
                 # Get Spanish quiz
-                spanish_phrases = await sheets_fetcher.fetch_all_spanish_phrases()
-                if spanish_phrases:
-                    phrase = random.choice(spanish_phrases)
+                phrase = await sheets_fetcher.fetch_random_spanish_phrase()
+                if phrase:
                     context['QUIZ_ME_ESPANOL'] = phrase.spanish
                     context['QuizMeIngles'] = phrase.english
                 else:
@@ -180,9 +346,6 @@ class BriefingOrchestrator:
                     
         except Exception as e:
             logger.error(f"Failed to gather Google Sheets data: {e}")
-            context['TRANSCRIPT_TABLE'] = "(data unavailable)"
-            context['QUIZ_ME_CS_TERM'] = "(data unavailable)"
-            context['QUIZ_ME_ESPANOL'] = "(data unavailable)"
     
     async def _gather_country_data(self, context: Dict[str, str]) -> None:
         """Gather random country data."""
@@ -196,25 +359,24 @@ class BriefingOrchestrator:
                     context['COUNTRY_CAPITAL_OF_THE_DAY'] = country.capital
                     context['CAPITAL_LOCATION_BREAKDOWN'] = location_desc
                 else:
-                    context['COUNTRY_OF_THE_DAY'] = "(Country not available)"
-                    context['COUNTRY_CAPITAL_OF_THE_DAY'] = "(Capital not available)"
-                    context['CAPITAL_LOCATION_BREAKDOWN'] = "(Location not available)"
+                    context.update(_COUNTRY_FALLBACKS)
                     
         except Exception as e:
             logger.error(f"Failed to gather country data: {e}")
-            context['COUNTRY_OF_THE_DAY'] = "(data unavailable)"
-            context['COUNTRY_CAPITAL_OF_THE_DAY'] = "(data unavailable)"
-            context['CAPITAL_LOCATION_BREAKDOWN'] = "(data unavailable)"
     
     async def _gather_year_based_data(self, context: Dict[str, str], year: int) -> None:
         """Gather data based on the current study year."""
         try:
-            # Load Oscar data
-            oscars_df = pd.read_csv(settings.datasets_dir / "Oscars.csv")
-            oscar_row = oscars_df[oscars_df['Year'] == year]
+            # Read the datasets off the event loop so network-bound gatherers
+            # keep making progress
+            oscars, presidents, inventions = await asyncio.to_thread(
+                _load_year_tables, settings.datasets_dir
+            )
+            
+            # Look up Oscar data
+            row = oscars.get(year)
             
-            if not oscar_row.empty:
-                row = oscar_row.iloc[0]
+            if row is not None:
                 context['CURRENT_YEAR_BEST_PICTURE'] = row['Best Picture']
                 context['CURRENT_YEAR_BEST_ACTOR_IN_PICTURE'] = row['Best Actor']
                 context['CURRENT_YEAR_BEST_CINEMATOGRAPHY'] = row['Best Cinematography']
@@ -238,35 +400,22 @@ class BriefingOrchestrator:
                     row['Best Foreign Film'], "movie_summary", 50
                 )
             else:
-                context['CURRENT_YEAR_BEST_PICTURE'] = f"No Oscars ceremony held in {year}"
-                context['CURRENT_YEAR_BEST_ACTOR_IN_PICTURE'] = f"No Oscars ceremony held in {year}"
-                context['CURRENT_YEAR_BEST_CINEMATOGRAPHY'] = f"No Oscars ceremony held in {year}"
-                context['CURRENT_YEAR_BEST_SCORE'] = f"No Oscars ceremony held in {year}"
-                context['CURRENT_YEAR_BEST_FOREIGN_FILM'] = f"No Oscars ceremony held in {year}"
-                context['CURRENT_YEAR_BEST_PICTURE_SUM'] = f"No Oscars ceremony held in {year}"
-                context['CURRENT_YEAR_BEST_ACTOR_IN_PICTURE_SUM'] = f"No Oscars ceremony held in {year}"
-                context['CURRENT_YEAR_BEST_CINEMATOGRAPHY_SUM'] = f"No Oscars ceremony held in {year}"
-                context['CURRENT_YEAR_BEST_SCORE_SUM'] = f"No Oscars ceremony held in {year}"
-                context['CURRENT_YEAR_BEST_FOREIGN_FILM_SUM'] = f"No Oscars ceremony held in {year}"
+                context.update(dict.fromkeys(OSCAR_KEYS, f"No Oscars ceremony held in {year}"))
             
-            # Load President data
-            presidents_df = pd.read_csv(settings.datasets_dir / "Presidents.csv")
-            president_row = presidents_df[presidents_df['Year'] == year]
+            # Look up President data
+            row = presidents.get(year)
             
-            if not president_row.empty:
-                row = president_row.iloc[0]
+            if row is not None:
                 context['CURRENT_YEAR_US_PRESIDENT_VPS'] = f"{row['President']} (President), {row['Vice President']} (Vice President)"
                 context['NEW_MAJOR_PRESIDENTIAL_DECISION'] = row['Major Decision']
             else:
                 context['CURRENT_YEAR_US_PRESIDENT_VPS'] = f"Presidential data not available for {year}"
                 context['NEW_MAJOR_PRESIDENTIAL_DECISION'] = f"Presidential decision data not available for {year}"
             
-            # Load Invention data
-            inventions_df = pd.read_csv(settings.datasets_dir / "Inventions.csv")
-            invention_row = inventions_df[inventions_df['Year'] == year]
+            # Look up Invention data
+            row = inventions.get(year)
             
-            if not invention_row.empty:
-                row = invention_row.iloc[0]
+            if row is not None:
                 context['MAJOR_INVENTION_OF_YEAR'] = row['Invention']
                 context['MAJOR_INVENTION_SUMMARY'] = row['Summary']
             else:
@@ -275,53 +424,26 @@ class BriefingOrchestrator:
                 
         except Exception as e:
             logger.error(f"Failed to gather year-based data: {e}")
-            context['CURRENT_YEAR_BEST_PICTURE'] = "(data unavailable)"
-            context['CURRENT_YEAR_BEST_ACTOR_IN_PICTURE'] = "(data unavailable)"
-            context['CURRENT_YEAR_BEST_CINEMATOGRAPHY'] = "(data unavailable)"
-            context['CURRENT_YEAR_BEST_SCORE'] = "(data unavailable)"
-            context['CURRENT_YEAR_BEST_FOREIGN_FILM'] = "(data unavailable)"
-            context['CURRENT_YEAR_BEST_PICTURE_SUM'] = "(data unavailable)"
-            context['CURRENT_YEAR_BEST_ACTOR_IN_PICTURE_SUM'] = "(data unavailable)"
-            context['CURRENT_YEAR_BEST_CINEMATOGRAPHY_SUM'] = "(data unavailable)"
-            context['CURRENT_YEAR_BEST_SCORE_SUM'] = "(data unavailable)"
-            context['CURRENT_YEAR_BEST_FOREIGN_FILM_SUM'] = "(data unavailable)"
-            context['CURRENT_YEAR_US_PRESIDENT_VPS'] = "(data unavailable)"
-            context['NEW_MAJOR_PRESIDENTIAL_DECISION'] = "(data unavailable)"
-            context['MAJOR_INVENTION_OF_YEAR'] = "(data unavailable)"
-            context['MAJOR_INVENTION_SUMMARY'] = "(data unavailable)"
     
     async def _gather_generated_facts(self, context: Dict[str, str], year: int, state: str) -> None:
         """Gather OpenAI-generated facts."""
         try:
-            # Generate various facts with word limits from define_fields.txt
-            facts = await asyncio.gather(
-                self.summarizer.generate_fact("", "ww1", 50),
-                self.summarizer.generate_fact("", "ww2", 50),
-                self.summarizer.generate_fact("", "europe", 50),
-                self.summarizer.generate_fact("", "ireland", 50),
-                self.summarizer.generate_fact("", "jerusalem", 50),
-                self.summarizer.generate_fact("", "india", 50),
-                self.summarizer.generate_fact("", "mexico", 50),
-                self.summarizer.generate_fact("", "stunt_rigging", 50),
-                self.summarizer.generate_fact("", "bike", 100),
-                self.summarizer.generate_fact(str(year), "nasa_launch", 100),
-                self.summarizer.generate_fact("", "gc", 100),
-                self.summarizer.summarize(state, "golf_summary", 150),
-                return_exceptions=True
-            )
+            # Generate all facts in a single batched request; only the NASA
+            # and golf facts depend on today's cycle
+            fact_content = {"nasa_launch": str(year), "golf_summary": state}
+            fact_specs = [
+                {
+                    "key": key,
+                    "type": fact_type,
+                    "content": fact_content.get(fact_type, ""),
+                    "word_limit": word_limit,
+                }
+                for key, fact_type, word_limit in FACT_SPECS
+            ]
+            facts = await self.summarizer.batch_generate(fact_specs)
             
-            context['WW1_FACT'] = facts[0] if not isinstance(facts[0], Exception) else "(data unavailable)"
-            context['WW2_FACT'] = facts[1] if not isinstance(facts[1], Exception) else "(data unavailable)"
-            context['EUROPE_FACT'] = facts[2] if not isinstance(facts[2], Exception) else "(data unavailable)"
-            context['IRELAND_FACT'] = facts[3] if not isinstance(facts[3], Exception) else "(data unavailable)"
-            context['JERUSALEM_FACT'] = facts[4] if not isinstance(facts[4], Exception) else "(data unavailable)"
-            context['INDIA_FACT'] = facts[5] if not isinstance(facts[5], Exception) else "(data unavailable)"
-            context['MEXICO_FACT'] = facts[6] if not isinstance(facts[6], Exception) else "(data unavailable)"
-            context['STUNT_RIGGING_SUMMARY'] = facts[7] if not isinstance(facts[7], Exception) else "(data unavailable)"
-            context['BIKE_FUN_FACT'] = facts[8] if not isinstance(facts[8], Exception) else "(data unavailable)"
-            context['NASA_LAUNCH_HISTORY'] = facts[9] if not isinstance(facts[9], Exception) else "(data unavailable)"
-            context['TEACH_ME_GC'] = facts[10] if not isinstance(facts[10], Exception) else "(data unavailable)"
-            context['CURRENT_GOLF_STATE_SUMMARY'] = facts[11] if not isinstance(facts[11], Exception) else "(data unavailable)"
+            for key, _, _ in FACT_SPECS:
+                context[key] = facts.get(key, "(data unavailable)")
             
             # Get codebase of the day
             try:
@@ -331,37 +453,19 @@ class BriefingOrchestrator:
                     context['CODEBASE_SUMMARY'] = repo_summary
             except Exception as e:
                 logger.error(f"Failed to get codebase: {e}")
-                context['CODEBASE_TODAY'] = "(Codebase not available)"
-                context['CODEBASE_SUMMARY'] = "(Summary not available)"
+                context.update(_CODEBASE_FALLBACKS)
             
         except Exception as e:
             logger.error(f"Failed to gather generated facts: {e}")
-            context['WW1_FACT'] = "(data unavailable)"
-            context['WW2_FACT'] = "(data unavailable)"
-            context['EUROPE_FACT'] = "(data unavailable)"
-            context['IRELAND_FACT'] = "(data unavailable)"
-            context['JERUSALEM_FACT'] = "(data unavailable)"
-            context['INDIA_FACT'] = "(data unavailable)"
-            context['MEXICO_FACT'] = "(data unavailable)"
-            context['STUNT_RIGGING_SUMMARY'] = "(data unavailable)"
-            context['BIKE_FUN_FACT'] = "(data unavailable)"
-            context['NASA_LAUNCH_HISTORY'] = "(data unavailable)"
-            context['TEACH_ME_GC'] = "(data unavailable)"
-            context['CURRENT_GOLF_STATE_SUMMARY'] = "(data unavailable)"
-            context['CODEBASE_TODAY'] = "(data unavailable)"
-            context['CODEBASE_SUMMARY'] = "(data unavailable)"
     
-    def _gather_language_section(self, context: Dict[str, str], now: datetime) -> None:
+    def _gather_language_section(self, context: Dict[str, str], day_of_year: int) -> None:
         """Gather daily language section."""
         try:
             # Use day of year to determine which language section to show
-            day_of_year = now.timetuple().tm_yday
-            
-            # Get daily language section
-            language_section = self.language_fetcher.get_daily_language_section(day_of_year)
+            language_section = self.language_fetcher.get_formatted_daily_section(day_of_year)
             
             if language_section:
-                context['DAILY_LANGUAGE_SECTION'] = self.language_fetcher.format_language_section(language_section)
+                context['DAILY_LANGUAGE_SECTION'] = language_section
             else:
                 context['DAILY_LANGUAGE_SECTION'] = "(Language section not available)"
                 
@@ -388,9 +492,12 @@ class BriefingOrchestrator:
             # Render template
             content = self.template_engine.render_template("daily_template.txt", context)
             
-            # Write files
-            txt_path = self.file_writer.write_daily_txt(content)
-            xlsx_path = self.file_writer.update_table_xlsx(context)
+            # Write files in worker threads; the txt and xlsx outputs are
+            # independent, so the slower openpyxl save overlaps the txt write
+            txt_path, xlsx_path = await asyncio.gather(
+                asyncio.to_thread(self.file_writer.write_daily_txt, content),
+                asyncio.to_thread(self.file_writer.update_table_xlsx, context),
+            )
             
             logger.info(f"Generated files: {txt_path}, {xlsx_path}")
             
@@ -399,7 +506,7 @@ class BriefingOrchestrator:
             
             if not dry_run and send_email:
                 # Send main briefing email
-                email_sent = self.emailer.send_daily_brief(content)
+                email_sent = await asyncio.to_thread(self.emailer.send_daily_brief, content)
                 
                 if email_sent:
                     logger.info("Daily briefing email sent successfully")
@@ -408,7 +515,7 @@ class BriefingOrchestrator:
                 
                 # Send alert email if there are missing fields
                 if missing_fields:
-                    alert_sent = self.emailer.send_alert_email(missing_fields)
+                    alert_sent = await asyncio.to_thread(self.emailer.send_alert_email, missing_fields)
                     if alert_sent:
                         logger.info(f"Alert email sent for {len(missing_fields)} missing fields")
                     else:
@@ -1,11 +1,23 @@
 """Settings configuration using Pydantic."""
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _make_directories(directories: Tuple[Path, ...]) -> None:
+    """Create directories (and parents) that do not exist yet.
+    
+    Not memoised: an Outputs/ directory deleted or rotated while the
+    process runs is recreated on the next call.
+    """
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
@@ -29,33 +41,38 @@ class Settings(BaseSettings):
     timezone: str = Field("America/Phoenix", description="Timezone for scheduling")
     root_dir: Path = Field(..., description="Project root directory")
     
-    # Derived paths
-    @property
+    # Derived paths (computed once on first access)
+    @cached_property
     def outputs_dir(self) -> Path:
         """Get outputs directory path."""
         return self.root_dir / "Outputs"
     
-    @property
+    @cached_property
     def dailies_dir(self) -> Path:
         """Get daily outputs directory path."""
         return self.outputs_dir / "dailies"
     
-    @property
+    @cached_property
     def tables_dir(self) -> Path:
         """Get tables directory path."""
         return self.outputs_dir / "tables"
     
-    @property
+    @cached_property
+    def cache_dir(self) -> Path:
+        """Get cache directory path (kept with the outputs, not the source)."""
+        return self.outputs_dir / ".cache"
+    
+    @cached_property
     def templates_dir(self) -> Path:
         """Get templates directory path."""
         return self.root_dir / "templates"
     
-    @property
+    @cached_property
     def datasets_dir(self) -> Path:
         """Get datasets directory path."""
         return self.root_dir / "src" / "datasets"
     
-    @property
+    @cached_property
     def transcript_dir(self) -> Path:
         """Get transcript directory path."""
         return self.root_dir / "paicc-2 copy"
@@ -70,16 +87,37 @@ class Settings(BaseSettings):
         return path
     
     def ensure_directories(self) -> None:
-        """Ensure all required directories exist."""
-        for directory in [
-            self.outputs_dir,
+        """Ensure all required directories exist.
+        
+        Only leaf directories are listed (outputs_dir is created as the
+        parent of dailies_dir, tables_dir and cache_dir).
+        """
+        _make_directories((
             self.dailies_dir,
             self.tables_dir,
+            self.cache_dir,
             self.templates_dir,
             self.datasets_dir,
-        ]:
-            directory.mkdir(parents=True, exist_ok=True)
+        ))
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, loading them on first use.
+    
+    Returns:
+        Shared Settings instance
+    """
+    return Settings()
+
+
+class _LazySettings:
+    """Proxy that defers loading the settings until an attribute is read."""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
 
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+# Global settings instance (validated on first attribute access, so imports
+# and --help stay cheap)
+settings: Settings = _LazySettings()  # type: ignore[assignment]
@@ -1,46 +1,117 @@
 """Template engine for rendering daily briefings using Jinja2."""
+import functools
+import hashlib
 import random
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Sequence, Tuple
 
-from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    meta,
+    select_autoescape,
+)
 
 from .settings import settings
 from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Private generator for unseeded phrase picks, so rotation never touches
+# the process-global random state
+_rng = random.Random()
+
+# Rotation phrases for GET_TO_IT_SAYING
+GET_TO_IT_PHRASES = (
+    "dive into",
+    "take a glance at",
+    "explore",
+    "breakdown",
+    "examine",
+    "check out",
+    "review",
+    "analyze",
+    "inspect",
+    "look at",
+)
+
+
+def rotate_phrase(phrase_list: Sequence[str], seed: str = None) -> str:
+    """Rotate through a list of phrases deterministically.
+    
+    Args:
+        phrase_list: List of phrases to choose from
+        seed: Optional seed for deterministic selection
+        
+    Returns:
+        Selected phrase
+    """
+    if not phrase_list:
+        return ""
+        
+    if seed:
+        # Hash the seed for a deterministic, stateless selection
+        digest = hashlib.blake2b(seed.encode("utf-8"), digest_size=8).digest()
+        return phrase_list[int.from_bytes(digest, "little") % len(phrase_list)]
+    else:
+        return _rng.choice(phrase_list)
+
+
+def get_to_it_phrase(fulldate: str) -> str:
+    """Get the GET_TO_IT_SAYING phrase for a date.
+    
+    Args:
+        fulldate: Formatted date the phrase is keyed on
+        
+    Returns:
+        Phrase for that date (random if fulldate is empty)
+    """
+    return rotate_phrase(GET_TO_IT_PHRASES, seed=fulldate)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_env(templates_dir: Path) -> Environment:
+    """Get the shared Jinja environment for a templates directory.
+    
+    Args:
+        templates_dir: Directory to load templates from
+        
+    Returns:
+        Environment shared by every TemplateEngine using that directory
+    """
+    env = Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(['html', 'xml']),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # TemplateEngine checks template mtimes itself, so skip Jinja's
+        # per-render check and reuse compiled bytecode across processes
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+    
+    # Add custom filters and globals
+    env.filters['rotate_phrase'] = rotate_phrase
+    env.globals['get_to_it_phrases'] = GET_TO_IT_PHRASES
+    env.globals['get_to_it_phrase'] = get_to_it_phrase
+    return env
+
 
 class TemplateEngine:
     """Handles template rendering with Jinja2."""
     
     def __init__(self):
         """Initialize the template engine."""
-        self.env = Environment(
-            loader=FileSystemLoader(settings.templates_dir),
-            autoescape=select_autoescape(['html', 'xml']),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.env = _get_env(settings.templates_dir)
+        self.get_to_it_phrases = GET_TO_IT_PHRASES
+        
+        # Compiled templates and their variable names, by template name
+        self._template_cache: Dict[str, Tuple[int, Template]] = {}
+        self._vars_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
         
-        # Load rotation phrases
-        self.get_to_it_phrases = [
-            "dive into",
-            "take a glance at",
-            "explore",
-            "breakdown",
-            "examine",
-            "check out",
-            "review",
-            "analyze",
-            "inspect",
-            "look at",
-        ]
-        
-        # Add custom filters
-        self.env.filters['rotate_phrase'] = self._rotate_phrase
-        
-    def _rotate_phrase(self, phrase_list: List[str], seed: str = None) -> str:
+    def _rotate_phrase(self, phrase_list: Sequence[str], seed: str = None) -> str:
         """Rotate through a list of phrases deterministically.
         
         Args:
@@ -50,17 +121,7 @@ class TemplateEngine:
         Returns:
             Selected phrase
         """
-        if not phrase_list:
-            return ""
-            
-        if seed:
-            # Use seed for deterministic selection
-            random.seed(seed)
-            choice = random.choice(phrase_list)
-            random.seed()  # Reset random seed
-            return choice
-        else:
-            return random.choice(phrase_list)
+        return rotate_phrase(phrase_list, seed)
     
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render a template with the given context.
@@ -73,19 +134,14 @@ class TemplateEngine:
             Rendered template string
         """
         try:
-            # Add rotation phrases to context
-            context['GET_TO_IT_SAYING'] = self._rotate_phrase(
-                self.get_to_it_phrases,
-                seed=context.get('FULLDATE', '')
-            )
-            
-            template = self.env.get_template(template_name)
+            self._fill_defaults(context)
+            template = self._get_template(template_name)
             rendered = template.render(**context)
             
             logger.info(
                 "Template rendered successfully",
                 template=template_name,
-                context_keys=list(context.keys()),
+                n_keys=len(context),
             )
             
             return rendered
@@ -98,6 +154,93 @@ class TemplateEngine:
             )
             raise
     
+    def render_string(self, source: str, context: Dict[str, Any]) -> str:
+        """Render template source held in memory.
+        
+        Args:
+            source: Template source text
+            context: Dictionary of template variables
+            
+        Returns:
+            Rendered template string
+        """
+        self._fill_defaults(context)
+        return self.env.from_string(source).render(**context)
+    
+    def get_string_variables(self, source: str) -> List[str]:
+        """Extract all variables from template source held in memory.
+        
+        Args:
+            source: Template source text
+            
+        Returns:
+            List of variable names found in the source
+        """
+        return sorted(meta.find_undeclared_variables(self.env.parse(source)))
+    
+    def _fill_defaults(self, context: Dict[str, Any]) -> None:
+        """Fill in the rotation phrase unless the caller already picked it.
+        
+        Args:
+            context: Dictionary of template variables (updated in place)
+        """
+        if 'GET_TO_IT_SAYING' not in context:
+            context['GET_TO_IT_SAYING'] = get_to_it_phrase(context.get('FULLDATE', ''))
+    
+    def _template_mtime(self, template_name: str) -> int:
+        """Get the modification time of a template file.
+        
+        Args:
+            template_name: Name of the template file
+            
+        Returns:
+            Modification time in nanoseconds
+        """
+        return (Path(self.env.loader.searchpath[0]) / template_name).stat().st_mtime_ns
+    
+    def _get_template(self, template_name: str) -> Template:
+        """Get a compiled template, reloading it when its file changes.
+        
+        Args:
+            template_name: Name of the template file
+            
+        Returns:
+            Compiled template
+        """
+        mtime_ns = self._template_mtime(template_name)
+        cached = self._template_cache.get(template_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        # Load through the loader so the environment's own cache (which
+        # never reloads, as auto_reload is off) cannot return a stale copy
+        template = self.env.loader.load(self.env, template_name, self.env.make_globals(None))
+        self._template_cache[template_name] = (mtime_ns, template)
+        return template
+    
+    def _required_variables(self, template_name: str) -> FrozenSet[str]:
+        """Get the cached set of variables a template reads.
+        
+        The template is only re-parsed when its file modification time
+        changes, so repeated lookups cost a single stat.
+        
+        Args:
+            template_name: Name of the template file
+            
+        Returns:
+            Set of variable names found in the template
+        """
+        mtime_ns = self._template_mtime(template_name)
+        cached = self._vars_cache.get(template_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        template_source = self.env.loader.get_source(self.env, template_name)[0]
+        template = self.env.parse(template_source)
+        variables = frozenset(meta.find_undeclared_variables(template))
+        self._vars_cache[template_name] = (mtime_ns, variables)
+        return variables
+    
     def get_template_variables(self, template_name: str) -> List[str]:
         """Extract all variables from a template.
         
@@ -108,15 +251,7 @@ class TemplateEngine:
             List of variable names found in the template
         """
         try:
-            template_source = self.env.loader.get_source(self.env, template_name)[0]
-            template = self.env.parse(template_source)
-            
-            variables = set()
-            for node in template.find_all():
-                if hasattr(node, 'name'):
-                    variables.add(node.name)
-                    
-            return sorted(list(variables))
+            return sorted(self._required_variables(template_name))
             
         except Exception as e:
             logger.error(
@@ -136,16 +271,24 @@ class TemplateEngine:
         Returns:
             List of missing variable names
         """
-        required_vars = self.get_template_variables(template_name)
-        provided_vars = set(context.keys())
-        
-        missing_vars = [var for var in required_vars if var not in provided_vars]
-        
-        if missing_vars:
-            logger.warning(
-                "Missing template variables",
+        try:
+            required_vars = self._required_variables(template_name)
+        except Exception as e:
+            logger.error(
+                "Failed to extract template variables",
                 template=template_name,
-                missing=missing_vars,
+                error=str(e),
             )
-            
+            return []
+        
+        missing = required_vars - context.keys()
+        if not missing:
+            return []
+        
+        missing_vars = sorted(missing)
+        logger.warning(
+            "Missing template variables",
+            template=template_name,
+            missing=missing_vars,
+        )
         return missing_vars
\ No newline at end of file
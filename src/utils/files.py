@@ -0,0 +1,30 @@
+"""File helpers for crash-safe writes of small state files."""
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """Atomically write JSON data to a file.
+
+    The data is written to a sibling temporary file, flushed to disk and
+    then renamed over the target, so readers never see a partial file.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data (written with a two-space indent)
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -3,37 +3,66 @@ import logging
 import sys
 from typing import Any, Dict
 
+import orjson
 import structlog
 from structlog.processors import CallsiteParameter
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for structlog's JSONRenderer.
+    
+    Args:
+        obj: Event dictionary to serialize
+        **kwargs: Serializer options from JSONRenderer (only default is used)
+        
+    Returns:
+        JSON string for the stdlib logger
+    """
+    # Unlike json.dumps, orjson rejects non-string keys unless told otherwise
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode("utf-8")
+
+
 def configure_logging(log_level: str = "INFO") -> None:
     """Configure structured logging for the application.
     
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
     """
-    # Configure structlog
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
+    level = getattr(logging, log_level.upper())
+    
+    processors = [
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+    ]
+    
+    # Call-site lookup walks the stack on every record, so only pay for it
+    # when debugging
+    if level <= logging.DEBUG:
+        processors.append(
             structlog.processors.CallsiteParameterAdder(
                 parameters=[
                     CallsiteParameter.FILENAME,
                     CallsiteParameter.FUNC_NAME,
                     CallsiteParameter.LINENO,
                 ]
-            ),
-            structlog.processors.JSONRenderer()
-        ],
+            )
+        )
+    
+    processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+    
+    # Configure structlog; calls below the level return before any processor
+    structlog.configure(
+        processors=processors,
         context_class=dict,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
@@ -42,7 +71,7 @@ def configure_logging(log_level: str = "INFO") -> None:
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=level,
     )
     
     # Suppress noisy loggers
@@ -1,6 +1,7 @@
 """Async retry decorator with exponential backoff."""
 import asyncio
 import functools
+import random
 from typing import Any, Callable, Optional, Tuple, Type, Union
 
 from structlog.stdlib import BoundLogger
@@ -9,6 +10,20 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Private generator for retry jitter (seeded from os.urandom), kept apart
+# from the process-global random state
+_rng = random.Random()
+
+
+class RetryableError(Exception):
+    """Base exception for errors that should trigger a retry."""
+    pass
+
+
+class NonRetryableError(Exception):
+    """Base exception for errors that should not trigger a retry."""
+    pass
+
 
 def async_retry(
     max_attempts: int = 3,
@@ -17,9 +32,14 @@ def async_retry(
     max_delay: float = 60.0,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
     log_errors: bool = True,
+    non_retryable: Tuple[Type[Exception], ...] = (NonRetryableError,),
 ) -> Callable:
     """Decorator for retrying async functions with exponential backoff.
     
+    Delays use decorrelated jitter: each one is drawn uniformly between
+    initial_delay and backoff_factor times the previous delay, so callers
+    failing together do not retry in lock-step.
+    
     Args:
         max_attempts: Maximum number of retry attempts
         initial_delay: Initial delay between retries in seconds
@@ -27,11 +47,17 @@ def async_retry(
         max_delay: Maximum delay between retries in seconds
         exceptions: Tuple of exceptions to catch and retry
         log_errors: Whether to log retry attempts
+        non_retryable: Exceptions re-raised immediately, even if they match
+            exceptions
         
     Returns:
         Decorated function
     """
     def decorator(func: Callable) -> Callable:
+        # Fixed per decorated function, so resolve them once here
+        func_name = func.__name__
+        last_attempt = max_attempts - 1
+        
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             delay = initial_delay
@@ -41,24 +67,29 @@ def async_retry(
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as e:
+                    if isinstance(e, non_retryable):
+                        raise
+                    
                     last_exception = e
                     
-                    if attempt == max_attempts - 1:
+                    if attempt == last_attempt:
                         # Last attempt failed
                         if log_errors:
                             logger.error(
                                 "Max retry attempts reached",
-                                function=func.__name__,
+                                function=func_name,
                                 attempt=attempt + 1,
                                 max_attempts=max_attempts,
                                 error=str(e),
                             )
                         raise
                     
+                    delay = min(max_delay, _rng.uniform(initial_delay, delay * backoff_factor))
+                    
                     if log_errors:
                         logger.warning(
                             "Retrying after error",
-                            function=func.__name__,
+                            function=func_name,
                             attempt=attempt + 1,
                             max_attempts=max_attempts,
                             delay=delay,
@@ -66,7 +97,6 @@ def async_retry(
                         )
                     
                     await asyncio.sleep(delay)
-                    delay = min(delay * backoff_factor, max_delay)
             
             # Should never reach here, but just in case
             if last_exception:
@@ -76,16 +106,6 @@ def async_retry(
     return decorator
 
 
-class RetryableError(Exception):
-    """Base exception for errors that should trigger a retry."""
-    pass
-
-
-class NonRetryableError(Exception):
-    """Base exception for errors that should not trigger a retry."""
-    pass
-
-
 async def retry_with_fallback(
     primary_func: Callable,
     fallback_func: Callable,
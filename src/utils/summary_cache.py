@@ -0,0 +1,147 @@
+"""Persistent cache for generated summaries backed by SQLite."""
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Default cache settings
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MEMORY_SIZE = 256
+
+
+def make_cache_key(
+    content: str,
+    prompt_type: str,
+    word_limit: int,
+    additional_context: Optional[str] = None,
+) -> str:
+    """Build a cache key from the inputs that determine a summary.
+
+    Args:
+        content: Content being summarized
+        prompt_type: Type of summary
+        word_limit: Word limit for the summary
+        additional_context: Additional prompt context
+
+    Returns:
+        Hex digest identifying the summary request
+    """
+    raw = f"{prompt_type}|{word_limit}|{additional_context or ''}|{content}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SummaryCache:
+    """Two-level (in-process LRU + SQLite) cache for summaries."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        memory_size: int = DEFAULT_MEMORY_SIZE,
+    ):
+        """Initialize the summary cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl_seconds: Maximum age of a cached entry in seconds
+            memory_size: Maximum number of entries kept in memory
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database lazily and ensure its directory and table exist.
+
+        Returns:
+            SQLite connection
+        """
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries("
+                "key TEXT PRIMARY KEY, value TEXT, created_at REAL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        """Store an entry in the in-process LRU."""
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _is_fresh(self, created_at: float, ttl_seconds: Optional[float]) -> bool:
+        """Check whether an entry is still within its TTL."""
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+        return time.time() - created_at < ttl_seconds
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[str]:
+        """Get a cached summary.
+
+        Args:
+            key: Cache key from make_cache_key
+            ttl_seconds: Maximum age for this lookup (defaults to the cache TTL;
+                use math.inf for entries that never expire)
+
+        Returns:
+            Cached summary, or None on a miss or expired entry
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            value, created_at = entry
+            if self._is_fresh(created_at, ttl_seconds):
+                self._memory.move_to_end(key)
+                return value
+            del self._memory[key]
+
+        try:
+            row = self._connect().execute(
+                "SELECT value, created_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read summary cache: {e}")
+            return None
+
+        if row is None or not self._is_fresh(row[1], ttl_seconds):
+            return None
+
+        self._remember(key, row[0], row[1])
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """Store a summary in the cache.
+
+        Args:
+            key: Cache key from make_cache_key
+            value: Summary to store
+        """
+        created_at = time.time()
+        self._remember(key, value, created_at)
+
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries(key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, created_at),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write summary cache: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
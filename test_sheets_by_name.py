@@ -2,40 +2,62 @@
 """Test accessing Google Sheets by sheet name in the URL."""
 
 import asyncio
+import functools
 import httpx
+import string
 import urllib.parse
 
 DOCUMENT_ID = "1pMNR5i3v1T-N63QnR_03X7ARWRR9PWJ3j0NP_jd4d7M"
 
-async def test_sheet_by_name(sheet_name: str):
+# URL formats to try for each sheet name
+URL_TEMPLATES = (
+    f"https://docs.google.com/spreadsheets/d/{DOCUMENT_ID}/gviz/tq?tqx=out:csv&sheet={{sheet}}",
+    f"https://docs.google.com/spreadsheets/d/{DOCUMENT_ID}/export?format=csv&sheet={{sheet}}",
+)
+
+# Characters that never need escaping in a query-string value
+URL_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "-_.~")
+
+
+@functools.lru_cache(maxsize=None)
+def _encode(sheet_name: str) -> str:
+    """URL encode a sheet name, passing URL-safe names through unchanged."""
+    if URL_SAFE_CHARS.issuperset(sheet_name):
+        return sheet_name
+    return urllib.parse.quote(sheet_name, safe='')
+
+
+async def test_sheet_by_name(client: httpx.AsyncClient, sheet_name: str):
     """Test accessing a sheet by name."""
     try:
         # URL encode the sheet name
-        encoded_name = urllib.parse.quote(sheet_name)
+        encoded_name = _encode(sheet_name)
         
         # Try different URL formats
-        urls = [
-            f"https://docs.google.com/spreadsheets/d/{DOCUMENT_ID}/gviz/tq?tqx=out:csv&sheet={encoded_name}",
-            f"https://docs.google.com/spreadsheets/d/{DOCUMENT_ID}/export?format=csv&sheet={encoded_name}",
-        ]
+        urls = [template.format(sheet=encoded_name) for template in URL_TEMPLATES]
+        
+        # Probe both formats at once, then report them in order
+        responses = await asyncio.gather(
+            *(client.get(url) for url in urls),
+            return_exceptions=True,
+        )
         
-        for url in urls:
+        for url, response in zip(urls, responses):
             print(f"\nTesting sheet '{sheet_name}' with URL format:")
             print(f"  {url}")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, follow_redirects=True)
-                
-                if response.status_code == 200 and response.text.strip():
-                    lines = response.text.strip().split('\n')
-                    print(f"  SUCCESS!")
-                    print(f"  Headers: {lines[0] if lines else 'No headers'}")
-                    print(f"  Row count: {len(lines) - 1}")
-                    if len(lines) > 1:
-                        print(f"  First data row: {lines[1][:100]}..." if len(lines[1]) > 100 else f"  First data row: {lines[1]}")
-                    return True
-                else:
-                    print(f"  Failed - Status {response.status_code}")
+            if isinstance(response, Exception):
+                print(f"  Error: {response}")
+            elif response.status_code == 200 and response.text.strip():
+                lines = response.text.strip().split('\n')
+                print(f"  SUCCESS!")
+                print(f"  Headers: {lines[0] if lines else 'No headers'}")
+                print(f"  Row count: {len(lines) - 1}")
+                if len(lines) > 1:
+                    print(f"  First data row: {lines[1][:100]}..." if len(lines[1]) > 100 else f"  First data row: {lines[1]}")
+                return True
+            else:
+                print(f"  Failed - Status {response.status_code}")
                     
     except Exception as e:
         print(f"  Error: {e}")
@@ -56,8 +78,11 @@ async def main():
         "Sheet3"
     ]
     
-    for sheet_name in sheet_names:
-        await test_sheet_by_name(sheet_name)
+    # One client for every probe so requests share the docs.google.com connection
+    async with httpx.AsyncClient(http2=True, follow_redirects=True, timeout=10.0) as client:
+        await asyncio.gather(
+            *(test_sheet_by_name(client, sheet_name) for sheet_name in sheet_names)
+        )
     
     print("\n" + "=" * 60)
     print("If only 'espanol' works, the other sheets may not exist in the Google Sheets document yet.")
@@ -0,0 +1,14 @@
+"""Fixtures shared across the test modules."""
+import pytest
+
+
+@pytest.fixture
+def temp_output_dir(tmp_path):
+    """Create per-test output directories (each test writes new files here).
+    
+    tmp_path is unique per test and per xdist worker, so parallel runs
+    never share output files.
+    """
+    (tmp_path / "dailies").mkdir()
+    (tmp_path / "tables").mkdir()
+    return tmp_path
@@ -1,28 +1,44 @@
 """Tests for the cycle engine."""
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
 
 from src.generators.cycle import CycleEngine, CycleState, US_STATES
 
+# Expected (year, state, days_left) for 10 successive days from the initial state
+EXPECTED_10_DAY_CYCLE = [
+    (1980, "Alabama", 3),    # Day 1 (initial)
+    (1980, "Alabama", 2),    # Day 2
+    (1980, "Alabama", 1),    # Day 3
+    (1981, "Alaska", 3),     # Day 4 (rollover)
+    (1981, "Alaska", 2),     # Day 5
+    (1981, "Alaska", 1),     # Day 6
+    (1982, "Arizona", 3),    # Day 7 (rollover)
+    (1982, "Arizona", 2),    # Day 8
+    (1982, "Arizona", 1),    # Day 9
+    (1983, "Arkansas", 3),   # Day 10 (rollover)
+]
+
 
 class TestCycleEngine:
     """Test the cycle engine functionality."""
     
     @pytest.fixture
-    def temp_state_file(self):
-        """Create a temporary state file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = Path(f.name)
-        yield temp_path
-        temp_path.unlink(missing_ok=True)
+    def temp_state_file(self, tmp_path):
+        """Get a state file path inside pytest's temporary directory."""
+        return tmp_path / "cycles.json"
     
     @pytest.fixture
     def cycle_engine(self, temp_state_file):
         """Create a cycle engine with a temporary state file."""
-        return CycleEngine(state_file=str(temp_state_file.name))
+        return CycleEngine(state_file=str(temp_state_file))
+    
+    @pytest.fixture(scope="class")
+    def ten_day_results(self, tmp_path_factory):
+        """Simulate the 10-day cycle once for all parametrized cases."""
+        state_file = tmp_path_factory.mktemp("cycle") / "cycles.json"
+        engine = CycleEngine(state_file=str(state_file))
+        return [engine.get_current()] + engine.simulate_days(9)
     
     def test_initial_state(self, cycle_engine):
         """Test initial state creation."""
@@ -32,31 +48,38 @@ class TestCycleEngine:
         assert state == "Alabama"
         assert days_left == 3
     
-    def test_10_day_cycle(self, cycle_engine):
+    @pytest.mark.parametrize("day_idx,expected", list(enumerate(EXPECTED_10_DAY_CYCLE)))
+    def test_10_day_cycle(self, ten_day_results, day_idx, expected):
         """Test 10 successive days produce correct 3-2-1 cycle and year/state rollover."""
-        expected_patterns = [
-            (1980, "Alabama", 3),    # Day 1 (initial)
-            (1980, "Alabama", 2),    # Day 2
-            (1980, "Alabama", 1),    # Day 3
-            (1981, "Alaska", 3),     # Day 4 (rollover)
-            (1981, "Alaska", 2),     # Day 5
-            (1981, "Alaska", 1),     # Day 6
-            (1982, "Arizona", 3),    # Day 7 (rollover)
-            (1982, "Arizona", 2),    # Day 8
-            (1982, "Arizona", 1),    # Day 9
-            (1983, "Arkansas", 3),   # Day 10 (rollover)
-        ]
+        assert ten_day_results[day_idx] == expected
+    
+    def test_long_run_matches_closed_form(self, cycle_engine):
+        """Test 500 simulated days follow the closed-form 3-day schedule."""
+        num_days = 500
+        results = [cycle_engine.get_current()] + cycle_engine.simulate_days(num_days)
         
-        # Get initial state
-        results = [cycle_engine.get_current()]
+        expected = [
+            (1980 + n // 3, US_STATES[(n // 3) % len(US_STATES)], 3 - n % 3)
+            for n in range(num_days + 1)
+        ]
+        assert results == expected
+    
+    @pytest.mark.parametrize("saved_index,expected_state", [
+        (len(US_STATES) + 1, "Alaska"),
+        (-1, "Wyoming"),
+    ])
+    def test_load_state_wraps_out_of_range_index(self, temp_state_file, saved_index, expected_state):
+        """Test a saved out-of-range index is wrapped instead of resetting the cycle."""
+        temp_state_file.write_text(json.dumps({
+            "year": 1995,
+            "state_index": saved_index,
+            "days_left": 2,
+            "last_updated": "2025-07-09T08:00:00",
+        }))
         
-        # Simulate 9 more days
-        simulated = cycle_engine.simulate_days(9)
-        results.extend(simulated)
+        engine = CycleEngine(state_file=str(temp_state_file))
         
-        # Verify each day matches expected pattern
-        for i, (expected, actual) in enumerate(zip(expected_patterns, results)):
-            assert actual == expected, f"Day {i+1}: Expected {expected}, got {actual}"
+        assert engine.get_current() == (1995, expected_state, 2)
     
     def test_state_wraparound(self, cycle_engine):
         """Test that states wrap around after reaching Wyoming."""
@@ -79,11 +102,11 @@ class TestCycleEngine:
     def test_persistence(self, temp_state_file):
         """Test that state persists across instances."""
         # Create first engine and advance
-        engine1 = CycleEngine(state_file=str(temp_state_file.name))
+        engine1 = CycleEngine(state_file=str(temp_state_file))
         engine1.reset(year=1985, state_index=5, days_left=2)
         
         # Create second engine with same file
-        engine2 = CycleEngine(state_file=str(temp_state_file.name))
+        engine2 = CycleEngine(state_file=str(temp_state_file))
         year, state, days_left = engine2.get_current()
         
         assert year == 1985
@@ -112,4 +135,16 @@ class TestCycleEngine:
         year, state, days_left = cycle_engine.get_current()
         assert year == 2020
         assert state == US_STATES[10]
-        assert days_left == 1
\ No newline at end of file
+        assert days_left == 1
+    
+    def test_reset_by_state_name(self, cycle_engine):
+        """Test reset accepts a state name."""
+        cycle_engine.reset(year=1990, state_index="Texas", days_left=2)
+        
+        year, state, days_left = cycle_engine.get_current()
+        assert year == 1990
+        assert state == "Texas"
+        assert cycle_engine.state.state_index == US_STATES.index("Texas")
+        
+        with pytest.raises(ValueError):
+            cycle_engine.reset(state_index="Atlantis")
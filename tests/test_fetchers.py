@@ -1,4 +1,8 @@
 """Tests for data fetchers."""
+from datetime import date
+from types import SimpleNamespace
+
+import httpx
 import pytest
 import respx
 from httpx import Response
@@ -6,19 +10,48 @@ from httpx import Response
 from src.fetchers.hn import HackerNewsFetcher, Article
 from src.fetchers.github_trend import GitHubTrendingFetcher, TrendingRepo
 from src.fetchers.countries import CountriesFetcher
+from src.fetchers.google_sheets import ROW_COUNT_QUERY, GoogleSheetsFetcher
+
+
+HN_API_URL = "https://hacker-news.firebaseio.com/v0"
+SHEETS_URL = "https://docs.google.com/spreadsheets/d/"
+
+# Default Hacker News items served by the mocked API
+HN_ITEMS = {
+    1: {"id": 1, "type": "story", "title": "Random News",
+        "score": 50, "by": "user1", "time": 1234567890},
+    2: {"id": 2, "type": "story", "title": "MCP and AI News",
+        "score": 100, "by": "user2", "time": 1234567890},
+    3: {"id": 3, "type": "story", "title": "Other Tech News",
+        "score": 75, "by": "user3", "time": 1234567890},
+}
+
+# Hacker News API routes, registered once; tests override single routes by name
+# and the router rolls overrides back when each test exits it
+hn_api_router = respx.mock(assert_all_called=False)
+hn_api_router.get(f"{HN_API_URL}/topstories.json", name="topstories").mock(
+    return_value=Response(200, json=list(HN_ITEMS))
+)
+for item_id, item in HN_ITEMS.items():
+    hn_api_router.get(f"{HN_API_URL}/item/{item_id}.json", name=f"item{item_id}").mock(
+        return_value=Response(200, json=item)
+    )
+
+
+@pytest.fixture
+def hn_api():
+    """Mock the Hacker News API for the duration of a test."""
+    with hn_api_router as router:
+        yield router
 
 
 class TestHackerNewsFetcher:
     """Test Hacker News fetcher."""
     
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_top_stories(self):
+    async def test_fetch_top_stories(self, hn_api):
         """Test fetching top story IDs."""
         # Mock the API response
-        respx.get("https://hacker-news.firebaseio.com/v0/topstories.json").mock(
-            return_value=Response(200, json=[1, 2, 3, 4, 5])
-        )
+        hn_api["topstories"].mock(return_value=Response(200, json=[1, 2, 3, 4, 5]))
         
         async with HackerNewsFetcher() as fetcher:
             story_ids = await fetcher.fetch_top_stories(limit=3)
@@ -26,9 +59,16 @@ class TestHackerNewsFetcher:
         assert len(story_ids) == 3
         assert story_ids == [1, 2, 3]
     
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_item(self):
+    async def test_shared_client_left_open(self, hn_api):
+        """Test that a shared client is used and not closed by the fetcher."""
+        async with httpx.AsyncClient() as client:
+            async with HackerNewsFetcher(client=client) as fetcher:
+                assert fetcher.client is client
+                await fetcher.fetch_top_stories(limit=3)
+                
+            assert not client.is_closed
+    
+    async def test_fetch_item(self, hn_api):
         """Test fetching a specific item."""
         # Mock the API response
         item_data = {
@@ -41,9 +81,7 @@ class TestHackerNewsFetcher:
             "time": 1234567890,
             "descendants": 50
         }
-        respx.get("https://hacker-news.firebaseio.com/v0/item/1.json").mock(
-            return_value=Response(200, json=item_data)
-        )
+        hn_api["item1"].mock(return_value=Response(200, json=item_data))
         
         async with HackerNewsFetcher() as fetcher:
             article = await fetcher.fetch_item(1)
@@ -53,67 +91,36 @@ class TestHackerNewsFetcher:
         assert article.url == "https://example.com"
         assert article.score == 100
     
-    def test_calculate_relevance_score(self):
+    @pytest.fixture(scope="class")
+    def hn_fetcher(self):
+        """Fetcher shared by the scoring tests (they make no requests)."""
+        return HackerNewsFetcher()
+    
+    @pytest.mark.parametrize("title, score, expected_score, expected_keywords", [
+        # Single keyword plus the high-HN-score bonus
+        ("New MCP Protocol Released", 150, 12, ["MCP"]),
+        # Multiple keywords earn the multi-match bonus
+        ("AI and Robotics Startup Disruption", 200, 47, ["robotics", "startup", "AI", "disruption"]),
+        # No keywords, only the moderate-HN-score bonus
+        ("Weekly Gardening Tips", 75, 1, []),
+    ])
+    def test_calculate_relevance_score(self, hn_fetcher, title, score, expected_score, expected_keywords):
         """Test relevance score calculation."""
-        fetcher = HackerNewsFetcher()
-        
-        # Article with MCP keyword
-        article1 = Article(
+        article = Article(
             id=1,
-            title="New MCP Protocol Released",
+            title=title,
             url="https://example.com",
             text=None,
-            score=150,
+            score=score,
             by="user1",
             time=1234567890
         )
-        score1, keywords1 = fetcher.calculate_relevance_score(article1)
-        assert score1 > 0
-        assert "MCP" in keywords1
-        
-        # Article with multiple keywords
-        article2 = Article(
-            id=2,
-            title="AI and Robotics Startup Disruption",
-            url="https://example.com",
-            text=None,
-            score=200,
-            by="user2",
-            time=1234567890
-        )
-        score2, keywords2 = fetcher.calculate_relevance_score(article2)
-        assert score2 > score1  # Multiple keywords should score higher
-        assert len(keywords2) > 1
+        relevance, keywords = hn_fetcher.calculate_relevance_score(article)
+        assert relevance == expected_score
+        assert keywords == expected_keywords
     
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_get_top_article(self):
+    async def test_get_top_article(self, hn_api):
         """Test getting the most relevant article."""
-        # Mock top stories response
-        respx.get("https://hacker-news.firebaseio.com/v0/topstories.json").mock(
-            return_value=Response(200, json=[1, 2, 3])
-        )
-        
-        # Mock individual items
-        respx.get("https://hacker-news.firebaseio.com/v0/item/1.json").mock(
-            return_value=Response(200, json={
-                "id": 1, "type": "story", "title": "Random News",
-                "score": 50, "by": "user1", "time": 1234567890
-            })
-        )
-        respx.get("https://hacker-news.firebaseio.com/v0/item/2.json").mock(
-            return_value=Response(200, json={
-                "id": 2, "type": "story", "title": "MCP and AI News",
-                "score": 100, "by": "user2", "time": 1234567890
-            })
-        )
-        respx.get("https://hacker-news.firebaseio.com/v0/item/3.json").mock(
-            return_value=Response(200, json={
-                "id": 3, "type": "story", "title": "Other Tech News",
-                "score": 75, "by": "user3", "time": 1234567890
-            })
-        )
-        
         async with HackerNewsFetcher() as fetcher:
             result = await fetcher.get_top_article()
             
@@ -123,33 +130,36 @@ class TestHackerNewsFetcher:
         assert len(keywords) > 0
 
 
+@pytest.fixture(scope="module")
+def trending_html():
+    """Sample HTML structure similar to GitHub trending page."""
+    return '''
+<article class="Box-row">
+    <h2 class="h3 lh-condensed">
+        <a href="/owner/repo-name">owner / repo-name</a>
+    </h2>
+    <p class="col-9 color-fg-muted my-1 pr-4">
+        This is a description with MCP support
+    </p>
+    <span itemprop="programmingLanguage">Python</span>
+    <a class="Link--muted d-inline-block mr-3" href="/owner/repo-name/stargazers">
+        <svg></svg> 1,234
+    </a>
+    <span class="float-sm-right">
+        <svg></svg> 123 stars today
+    </span>
+</article>
+'''
+
+
 class TestGitHubTrendingFetcher:
     """Test GitHub trending fetcher."""
     
-    def test_parse_trending_repos(self):
+    def test_parse_trending_repos(self, trending_html):
         """Test parsing HTML to extract repositories."""
         fetcher = GitHubTrendingFetcher()
         
-        # Sample HTML structure similar to GitHub trending page
-        html = '''
-        <article class="Box-row">
-            <h2 class="h3 lh-condensed">
-                <a href="/owner/repo-name">owner / repo-name</a>
-            </h2>
-            <p class="col-9 color-fg-muted my-1 pr-4">
-                This is a description with MCP support
-            </p>
-            <span itemprop="programmingLanguage">Python</span>
-            <a class="Link--muted d-inline-block mr-3" href="/owner/repo-name/stargazers">
-                <svg></svg> 1,234
-            </a>
-            <span class="float-sm-right">
-                <svg></svg> 123 stars today
-            </span>
-        </article>
-        '''
-        
-        repos = fetcher.parse_trending_repos(html)
+        repos = fetcher.parse_trending_repos(trending_html)
         assert len(repos) == 1
         
         repo = repos[0]
@@ -197,15 +207,76 @@ class TestGitHubTrendingFetcher:
         assert "Model Context Protocol" in mcp_repo2.description
 
 
+class TestGoogleSheetsFetcher:
+    """Test Google Sheets fetcher."""
+    
+    @pytest.fixture(autouse=True)
+    def row_count_cache(self, monkeypatch):
+        """Give each test an empty row count cache."""
+        cache = {}
+        monkeypatch.setattr('src.fetchers.google_sheets._ROW_COUNT_CACHE', cache)
+        return cache
+    
+    @respx.mock
+    async def test_fetch_random_cs_term_single_row(self):
+        """Test a random CS term is fetched without downloading the whole sheet."""
+        queries = []
+        
+        def gviz_response(request):
+            query = request.url.params.get("tq")
+            queries.append(query)
+            if query == ROW_COUNT_QUERY:
+                return Response(200, text='"count Concept","count Define"\n"2","3"\n')
+            return Response(200, text='"Concept","Define"\n"Closure","A function with captured scope"\n')
+        
+        respx.get(url__startswith=SHEETS_URL).mock(
+            side_effect=gviz_response
+        )
+        
+        async with GoogleSheetsFetcher() as fetcher:
+            term = await fetcher.fetch_random_cs_term()
+            
+        assert term is not None
+        assert term.term == "Closure"
+        assert term.definition == "A function with captured scope"
+        assert queries[-1].startswith("select * limit 1 offset ")
+        assert None not in queries  # Never fetched the full sheet
+    
+    @respx.mock
+    async def test_row_count_cache_keeps_current_day(self, monkeypatch, row_count_cache):
+        """Test row counts are reused within a day and dropped the next day."""
+        route = respx.get(url__startswith=SHEETS_URL).mock(
+            return_value=Response(200, text='"count Concept","count Define"\n"5","4"\n')
+        )
+        days = iter([date(2025, 7, 8), date(2025, 7, 8), date(2025, 7, 9)])
+        monkeypatch.setattr('src.fetchers.google_sheets.date', SimpleNamespace(today=lambda: next(days)))
+        
+        async with GoogleSheetsFetcher() as fetcher:
+            assert await fetcher._get_row_count("cs_terms") == 5
+            assert await fetcher._get_row_count("cs_terms") == 5
+            assert route.call_count == 1
+            
+            assert await fetcher._get_row_count("cs_terms") == 5
+            assert route.call_count == 2
+        
+        assert list(row_count_cache) == [date(2025, 7, 9)]
+
+
+@pytest.fixture(scope="module")
+def countries_fetcher():
+    """Countries fetcher with Countries.csv parsed once for the module."""
+    fetcher = CountriesFetcher()
+    fetcher.load_countries()
+    return fetcher
+
+
 class TestCountriesFetcher:
     """Test countries fetcher."""
     
-    @pytest.mark.asyncio
-    async def test_load_countries(self):
+    def test_load_countries(self, countries_fetcher):
         """Test loading countries from CSV."""
-        async with CountriesFetcher() as fetcher:
-            countries = fetcher.load_countries()
-            
+        countries = countries_fetcher.load_countries()
+        
         assert len(countries) > 0
         
         # Check first country (Afghanistan)
@@ -215,12 +286,10 @@ class TestCountriesFetcher:
         assert first_country.region == "Asia"
         assert first_country.population > 0
     
-    @pytest.mark.asyncio
-    async def test_get_random_country(self):
+    async def test_get_random_country(self, countries_fetcher):
         """Test getting a random country."""
-        async with CountriesFetcher() as fetcher:
-            result = await fetcher.get_random_country()
-            
+        result = await countries_fetcher.get_random_country()
+        
         assert result is not None
         country, location_desc = result
         
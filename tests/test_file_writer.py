@@ -1,30 +1,33 @@
 """Tests for file writer module."""
-import tempfile
+import csv
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
-import pandas as pd
 import pytest
 from openpyxl import load_workbook
 
 from src.file_writer import FileWriter
 
 
+def _table_rows(filepath):
+    """Read a table workbook as its header row and dicts keyed by header."""
+    wb = load_workbook(filepath, read_only=True)
+    header, *rows = wb.active.iter_rows(values_only=True)
+    wb.close()
+    return header, [dict(zip(header, row)) for row in rows]
+
+
+def _csv_rows(output_dir):
+    """Read the cumulative table CSV as its header and dict rows."""
+    with open(output_dir / "tables" / "Table.csv", newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
 class TestFileWriter:
     """Test file writer functionality."""
     
-    @pytest.fixture
-    def temp_output_dir(self):
-        """Create temporary output directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_path = Path(tmpdir)
-            dailies_dir = base_path / "dailies"
-            tables_dir = base_path / "tables"
-            dailies_dir.mkdir(parents=True)
-            tables_dir.mkdir(parents=True)
-            yield base_path
-    
     @pytest.fixture
     def file_writer(self, temp_output_dir):
         """Create file writer with temporary directories."""
@@ -33,7 +36,7 @@ class TestFileWriter:
             mock_settings.dailies_dir = temp_output_dir / "dailies"
             mock_settings.tables_dir = temp_output_dir / "tables"
             mock_settings.ensure_directories = lambda: None
-            return FileWriter()
+            yield FileWriter()
     
     def test_get_date_string(self, file_writer):
         """Test date string formatting."""
@@ -94,18 +97,15 @@ class TestFileWriter:
         assert filepath.exists()
         assert filepath.name == "Table_07.09.25.xlsx"
         
-        # Load and check content
-        wb = load_workbook(filepath)
-        ws = wb.active
-        
-        # Check headers (row 1)
-        assert ws.cell(row=1, column=1).value == "Date"
-        assert ws.cell(row=1, column=2).value == "FIELD1"
+        # Load and check content; template fields come before custom ones
+        header, rows = _table_rows(filepath)
+        assert header[0] == "Date"
+        assert {"FIELD1", "FIELD2", "FIELD3"} <= set(header)
         
-        # Check data (row 2)
-        assert ws.cell(row=2, column=1).value == "2025-07-09"
-        assert ws.cell(row=2, column=2).value == "Value 1"
-        assert ws.cell(row=2, column=3).value == "Value 2"
+        assert len(rows) == 1
+        assert rows[0]["Date"] == "2025-07-09"
+        assert rows[0]["FIELD1"] == "Value 1"
+        assert rows[0]["FIELD2"] == "Value 2"
     
     def test_update_table_xlsx_append(self, file_writer, temp_output_dir):
         """Test appending to existing XLSX table."""
@@ -126,17 +126,77 @@ class TestFileWriter:
         filepath2 = file_writer.update_table_xlsx(context2, date2)
         
         # Load and check
-        wb = load_workbook(filepath2)
-        ws = wb.active
+        _, rows = _table_rows(filepath2)
         
-        # Should have 3 rows (header + 2 data rows)
-        assert ws.max_row == 3
+        # Should have 2 data rows
+        assert len(rows) == 2
         
         # Check both days' data
-        assert ws.cell(row=2, column=1).value == "2025-07-08"
-        assert ws.cell(row=2, column=2).value == "Day 1 Value"
-        assert ws.cell(row=3, column=1).value == "2025-07-09"
-        assert ws.cell(row=3, column=2).value == "Day 2 Value"
+        assert rows[0]["Date"] == "2025-07-08"
+        assert rows[0]["FIELD1"] == "Day 1 Value"
+        assert rows[1]["Date"] == "2025-07-09"
+        assert rows[1]["FIELD1"] == "Day 2 Value"
+        
+        # The workbook mirrors the cumulative CSV
+        _, csv_rows = _csv_rows(temp_output_dir)
+        assert [(row["Date"], row["FIELD2"]) for row in csv_rows] == [
+            ("2025-07-08", "Day 1 Value 2"),
+            ("2025-07-09", "Day 2 Value 2"),
+        ]
+    
+    def test_update_table_xlsx_keeps_csv_history(self, file_writer, temp_output_dir):
+        """Test each update appends to the cumulative CSV the workbook is built from."""
+        file_writer.update_table_xlsx({"FULLDATE": "Day 1"}, datetime(2025, 7, 8))
+        filepath = file_writer.update_table_xlsx({"FULLDATE": "Day 2"}, datetime(2025, 7, 9))
+        
+        with open(temp_output_dir / "tables" / "Table.csv", newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[0][:2] == ["Date", "FULLDATE"]
+        assert [row[:2] for row in rows[1:]] == [
+            ["2025-07-08", "Day 1"],
+            ["2025-07-09", "Day 2"],
+        ]
+        
+        wb = load_workbook(filepath, read_only=True)
+        values = [row[:2] for row in wb.active.iter_rows(min_row=2, values_only=True)]
+        wb.close()
+        assert values == [("2025-07-08", "Day 1"), ("2025-07-09", "Day 2")]
+    
+    def test_update_table_xlsx_follows_csv_header(self, file_writer, temp_output_dir):
+        """Test rows are written under the CSV's header and new keys extend it."""
+        with open(temp_output_dir / "tables" / "Table.csv", 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([
+                ["Date", "FIELD2", "FIELD1"],
+                ["2025-07-08", "Old 2", "Old 1"],
+            ])
+        
+        context = {"FIELD1": "New 1", "FIELD2": "New 2", "NEW_FIELD": "Extra"}
+        filepath = file_writer.update_table_xlsx(context, datetime(2025, 7, 9))
+        
+        header, rows = _csv_rows(temp_output_dir)
+        assert header[:3] == ["Date", "FIELD2", "FIELD1"]
+        assert header[-1] == "NEW_FIELD"
+        assert rows[0]["FIELD1"] == "Old 1"
+        assert rows[0]["NEW_FIELD"] == ""
+        assert (rows[1]["FIELD1"], rows[1]["FIELD2"], rows[1]["NEW_FIELD"]) == ("New 1", "New 2", "Extra")
+        
+        _, xlsx_rows = _table_rows(filepath)
+        assert xlsx_rows[1]["FIELD2"] == "New 2"
+    
+    def test_update_table_xlsx_same_day_replaces_row(self, file_writer, temp_output_dir):
+        """Test a second run on the same date replaces that date's row."""
+        file_writer.update_table_xlsx({"FIELD1": "Day 1"}, datetime(2025, 7, 8))
+        file_writer.update_table_xlsx({"FIELD1": "First run"}, datetime(2025, 7, 9))
+        filepath = file_writer.update_table_xlsx({"FIELD1": "Second run"}, datetime(2025, 7, 9))
+        
+        _, rows = _csv_rows(temp_output_dir)
+        assert [(row["Date"], row["FIELD1"]) for row in rows] == [
+            ("2025-07-08", "Day 1"),
+            ("2025-07-09", "Second run"),
+        ]
+        
+        _, xlsx_rows = _table_rows(filepath)
+        assert len(xlsx_rows) == 2
     
     def test_get_headers_from_context(self, file_writer):
         """Test extracting headers from context."""
@@ -1,44 +1,116 @@
 """Tests for content generators."""
+import copy
 import json
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+import random
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.generators.codebase import CodebaseSelector, Repository
-from src.generators.summariser import Summarizer
+from src.generators.codebase import CODEBASE_HISTORY_FILE, CodebaseSelector, Repository
+from src.generators.summariser import FACT_CACHE_TTL_SECONDS, SUMMARY_CACHE_FILE, Summarizer
+from src.utils.summary_cache import SummaryCache
+
+
+def _async_stub(*results):
+    """Build an async stand-in for a client method that records its calls.
+    
+    Calls return the given results in order, repeating the last one; a
+    result that is an exception instance is raised instead.
+    """
+    async def method(*args, **kwargs):
+        method.calls.append(SimpleNamespace(args=args, kwargs=kwargs))
+        result = results[min(len(method.calls), len(results)) - 1]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+    
+    method.calls = []
+    return method
+
+
+def _chat_response(content):
+    """Build a minimal non-streaming OpenAI chat completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+# Canned OpenAI response, shared read-only by every test that needs one
+_OAI_RESP = _chat_response("This is a test summary.")
+
+# Settings prototypes, copied per test and given that test's directories
+CODEBASE_SETTINGS = SimpleNamespace(root_dir=None, github_token="fake_token")
+SUMMARIZER_SETTINGS = SimpleNamespace(cache_dir=None, openai_api_key="test_key")
+
+
+@pytest.fixture(scope="session")
+def mock_openai_response():
+    """Mock OpenAI API response."""
+    return _OAI_RESP
+
+
+@pytest.fixture(scope="module")
+def sample_repos():
+    """Five test repositories, built once for the module."""
+    return tuple(
+        Repository(
+            name=f"repo{i}",
+            full_name=f"user/repo{i}",
+            description=f"Description {i}",
+            url=f"https://github.com/user/repo{i}",
+            language="Python",
+            stars=i * 10,
+            created_at="2024-01-01",
+            updated_at="2024-01-01",
+            private=False,
+            size=100,
+            default_branch="main",
+            topics=[]
+        )
+        for i in range(5)
+    )
 
 
 class TestCodebaseSelector:
     """Test codebase selector functionality."""
     
     @pytest.fixture
-    def temp_history_file(self):
-        """Create a temporary history file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = Path(f.name)
-        yield temp_path
-        temp_path.unlink(missing_ok=True)
+    def temp_history_file(self, tmp_path):
+        """Path of the history file inside a per-test root directory."""
+        return tmp_path / CODEBASE_HISTORY_FILE
     
     @pytest.fixture
-    def mock_settings(self, temp_history_file):
+    def mock_settings(self, monkeypatch, temp_history_file):
         """Mock settings with temporary paths."""
-        with patch('src.generators.codebase.settings') as mock:
-            mock.root_dir = temp_history_file.parent
-            mock.github_token = "fake_token"
-            yield mock
+        mock = copy.copy(CODEBASE_SETTINGS)
+        mock.root_dir = temp_history_file.parent
+        monkeypatch.setattr('src.generators.codebase.settings', mock)
+        return mock
+    
+    @pytest.fixture(scope="class")
+    def shared_selector(self, tmp_path_factory):
+        """One selector (and HTTP client) shared by the whole class."""
+        mock = copy.copy(CODEBASE_SETTINGS)
+        mock.root_dir = tmp_path_factory.mktemp("codebase")
+        with patch('src.generators.codebase.settings', mock):
+            return CodebaseSelector()
     
-    def test_load_history_empty(self, mock_settings):
+    @pytest.fixture
+    def selector(self, shared_selector, monkeypatch, temp_history_file):
+        """Shared selector with its history reset to a per-test file."""
+        monkeypatch.setattr(shared_selector, "history_file", temp_history_file)
+        monkeypatch.setattr(shared_selector, "_history", None)
+        monkeypatch.setattr(shared_selector, "_history_dirty", False)
+        return shared_selector
+    
+    def test_load_history_empty(self, selector):
         """Test loading history when file doesn't exist."""
-        selector = CodebaseSelector()
         history = selector._load_history()
         assert history == []
     
-    def test_save_and_load_history(self, mock_settings):
+    def test_save_and_load_history(self, selector):
         """Test saving and loading history."""
-        selector = CodebaseSelector()
-        
         # Save history
         test_history = ["repo1", "repo2", "repo3"]
         selector._save_history(test_history)
@@ -47,68 +119,54 @@ class TestCodebaseSelector:
         loaded_history = selector._load_history()
         assert loaded_history == test_history
     
-    def test_select_repository_no_repetition(self, mock_settings):
-        """Test repository selection avoids recent repetitions."""
-        selector = CodebaseSelector()
-        
-        # Create test repositories
-        repos = [
-            Repository(
-                name=f"repo{i}",
-                full_name=f"user/repo{i}",
-                description=f"Description {i}",
-                url=f"https://github.com/user/repo{i}",
-                language="Python",
-                stars=i * 10,
-                created_at="2024-01-01",
-                updated_at="2024-01-01",
-                private=False,
-                size=100,
-                default_branch="main",
-                topics=[]
-            )
-            for i in range(5)
-        ]
+    def test_history_file_round_trip(self, selector):
+        """Test a large history survives a write and re-read from disk."""
+        test_history = [f"repo{i}" for i in range(10_000)]
+        selector._save_history(test_history)
         
+        assert selector._read_history() == test_history
+        assert json.loads(selector.history_file.read_text()) == {"history": test_history}
+    
+    async def test_selections_written_once_on_close(self, mock_settings, sample_repos):
+        """Test many selections are batched into a single history write."""
+        with patch('src.generators.codebase.atomic_write_json') as mock_write:
+            async with CodebaseSelector() as selector:
+                for _ in range(1000):
+                    selector.select_repository(sample_repos)
+                assert mock_write.call_count == 0
+        
+        mock_write.assert_called_once()
+        written_history = mock_write.call_args[0][1]["history"]
+        assert len(written_history) == 10
+        assert written_history == selector._load_history()
+    
+    def test_select_repository_no_repetition(self, selector, sample_repos):
+        """Test repository selection avoids recent repetitions."""
         # Set history with recent selections
         selector._save_history(["repo1", "repo2"])
         
-        # Select repository multiple times
-        selected_names = set()
-        for _ in range(10):
-            selected = selector.select_repository(repos)
-            selected_names.add(selected.name)
+        # A seeded generator makes the pick reproducible
+        selected = selector.select_repository(sample_repos, rng=random.Random(0))
         
-        # Should avoid repo1 and repo2 if possible
-        assert "repo0" in selected_names or "repo3" in selected_names or "repo4" in selected_names
+        # Recent repo1 and repo2 are skipped; seed 0 picks repo3 from the rest
+        assert selected.name == "repo3"
     
-    def test_select_repository_single_repo(self, mock_settings):
+    def test_selection_candidates_skip_recent(self, selector, sample_repos):
+        """Test recently selected repositories are excluded from the draw."""
+        candidates = selector._selection_candidates(sample_repos, ["repo1", "repo2"])
+        assert [r.name for r in candidates] == ["repo0", "repo3", "repo4"]
+        
+        # When every repository is recent, all of them are eligible again
+        pair = sample_repos[:2]
+        assert selector._selection_candidates(pair, ["repo0", "repo1"]) == list(pair)
+    
+    def test_select_repository_single_repo(self, selector, sample_repos):
         """Test selection when only one repository exists."""
-        selector = CodebaseSelector()
-        
-        repo = Repository(
-            name="only-repo",
-            full_name="user/only-repo",
-            description="The only repository",
-            url="https://github.com/user/only-repo",
-            language="Python",
-            stars=100,
-            created_at="2024-01-01",
-            updated_at="2024-01-01",
-            private=False,
-            size=100,
-            default_branch="main",
-            topics=[]
-        )
-        
-        selected = selector.select_repository([repo])
-        assert selected.name == "only-repo"
+        selected = selector.select_repository(sample_repos[:1])
+        assert selected.name == "repo0"
     
-    @pytest.mark.asyncio
-    async def test_fetch_repo_structure(self, mock_settings):
+    async def test_fetch_repo_structure(self, selector, monkeypatch, sample_repos):
         """Test fetching repository structure."""
-        selector = CodebaseSelector()
-        
         # Mock the HTTP response
         mock_response = MagicMock()
         mock_response.json.return_value = [
@@ -118,55 +176,66 @@ class TestCodebaseSelector:
             {"name": "setup.py", "type": "file"},
         ]
         
-        selector.client.get = AsyncMock(return_value=mock_response)
+        monkeypatch.setattr(selector.client, "get", _async_stub(mock_response))
         
-        repo = Repository(
-            name="test-repo",
-            full_name="user/test-repo",
-            description="Test repository",
-            url="https://github.com/user/test-repo",
-            language="Python",
-            stars=100,
-            created_at="2024-01-01",
-            updated_at="2024-01-01",
-            private=False,
-            size=100,
-            default_branch="main",
-            topics=[]
-        )
-        
-        structure = await selector.fetch_repo_structure(repo)
+        structure = await selector.fetch_repo_structure(sample_repos[0])
         
-        assert "Repository: test-repo" in structure
+        assert "Repository: repo0" in structure
         assert "📁 src/" in structure
         assert "📁 tests/" in structure
         assert "📄 README.md" in structure
         assert "📄 setup.py" in structure
 
 
+class FakeStream:
+    """Minimal stand-in for an OpenAI async chat completion stream."""
+    
+    def __init__(self, deltas):
+        self.chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+            for delta in deltas
+        ]
+        self.closed = False
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.closed = True
+    
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
 class TestSummarizer:
     """Test content summarizer."""
     
+    @pytest.fixture(scope="class")
+    def shared_summarizer(self, tmp_path_factory):
+        """One summarizer (and OpenAI client) shared by the whole class."""
+        mock = copy.copy(SUMMARIZER_SETTINGS)
+        mock.cache_dir = tmp_path_factory.mktemp("summarizer")
+        with patch('src.generators.summariser.settings', mock):
+            return Summarizer()
+    
     @pytest.fixture
-    def mock_openai_response(self):
-        """Mock OpenAI API response."""
-        mock_choice = MagicMock()
-        mock_choice.message.content = "This is a test summary."
-        
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-        
-        return mock_response
+    def summarizer(self, shared_summarizer, monkeypatch, tmp_path):
+        """Shared summarizer with an empty per-test summary cache."""
+        cache = SummaryCache(tmp_path / SUMMARY_CACHE_FILE)
+        monkeypatch.setattr(shared_summarizer, "cache", cache)
+        yield shared_summarizer
+        cache.close()
+    
+    @pytest.fixture
+    def mock_openai_stream(self):
+        """Mock streaming OpenAI API response (replayable across calls)."""
+        return FakeStream(["This is ", "a test ", "summary."])
     
-    @pytest.mark.asyncio
-    async def test_summarize_success(self, mock_openai_response):
+    async def test_summarize_success(self, summarizer, monkeypatch, mock_openai_stream):
         """Test successful summarization."""
-        summarizer = Summarizer()
-        
         # Mock the OpenAI client
-        summarizer.client.chat.completions.create = AsyncMock(
-            return_value=mock_openai_response
-        )
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(mock_openai_stream))
         
         result = await summarizer.summarize(
             "This is test content to summarize",
@@ -177,25 +246,55 @@ class TestSummarizer:
         assert result == "This is a test summary."
         
         # Check that the API was called
-        summarizer.client.chat.completions.create.assert_called_once()
+        assert len(summarizer.client.chat.completions.create.calls) == 1
     
-    @pytest.mark.asyncio
-    async def test_summarize_empty_content(self):
-        """Test summarizing empty content."""
-        summarizer = Summarizer()
+    async def test_summarize_uses_cache(self, summarizer, monkeypatch, mock_openai_stream):
+        """Test repeated summaries are served from the cache."""
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(mock_openai_stream))
+        
+        first = await summarizer.summarize("Cached content", "summary", 100)
+        second = await summarizer.summarize("Cached content", "summary", 100)
+        
+        assert first == second == "This is a test summary."
+        assert len(summarizer.client.chat.completions.create.calls) == 1
         
+        # A different word limit is a different cache entry
+        await summarizer.summarize("Cached content", "summary", 50)
+        assert len(summarizer.client.chat.completions.create.calls) == 2
+    
+    async def test_summarize_reads_whole_stream(self, summarizer, monkeypatch):
+        """Test summaries are bounded by the token limit, not cut mid-stream."""
+        stream = FakeStream(["One two. ", "Three four. ", "Five six."])
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(stream))
+        
+        result = await summarizer.summarize("README text", "codebase_summary", 2)
+        
+        assert result == "One two. Three four. Five six."
+        assert stream.closed
+        call_kwargs = summarizer.client.chat.completions.create.calls[-1].kwargs
+        assert call_kwargs['stream'] is True
+        assert call_kwargs['max_completion_tokens'] == 4
+    
+    def test_default_cache_in_cache_dir(self, tmp_path):
+        """Test the default summary cache is created under settings.cache_dir."""
+        mock = copy.copy(SUMMARIZER_SETTINGS)
+        mock.cache_dir = tmp_path / "Outputs" / ".cache"
+        with patch('src.generators.summariser.settings', mock):
+            cache = Summarizer().cache
+        
+        cache.set("key", "value")
+        cache.close()
+        assert (mock.cache_dir / SUMMARY_CACHE_FILE).exists()
+    
+    async def test_summarize_empty_content(self, summarizer):
+        """Test summarizing empty content."""
         result = await summarizer.summarize("", "summary", 100)
         assert result == "(No content to summarize)"
     
-    @pytest.mark.asyncio
-    async def test_summarize_error_handling(self):
+    async def test_summarize_error_handling(self, summarizer, monkeypatch):
         """Test error handling in summarization."""
-        summarizer = Summarizer()
-        
         # Mock the OpenAI client to raise an error
-        summarizer.client.chat.completions.create = AsyncMock(
-            side_effect=Exception("API Error")
-        )
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(Exception("API Error")))
         
         result = await summarizer.summarize(
             "Test content",
@@ -206,58 +305,35 @@ class TestSummarizer:
         assert "(Summary generation failed:" in result
         assert "API Error" in result
     
-    def test_build_prompt_types(self):
+    @pytest.mark.parametrize("content,kind,n,extra,needle", [
+        ("test content", "summary", 100, None, "Summarize"),
+        ("test content", "keypoints", 50, None, "key facts"),
+        ("test content", "summary", 100, "Additional context here", "Additional context here"),
+    ])
+    def test_build_prompt_types(self, summarizer, content, kind, n, extra, needle):
         """Test different prompt types."""
-        summarizer = Summarizer()
-        
-        # Test summary prompt
-        prompt = summarizer._build_prompt("test content", "summary", 100, None)
-        assert "Summarize" in prompt
-        assert "100 words" in prompt
-        assert "test content" in prompt
-        
-        # Test keypoints prompt
-        prompt = summarizer._build_prompt("test content", "keypoints", 50, None)
-        assert "key facts" in prompt
-        assert "50 words" in prompt
-        
-        # Test with additional context
-        prompt = summarizer._build_prompt(
-            "test content",
-            "summary",
-            100,
-            "Additional context here"
-        )
-        assert "Additional context here" in prompt
+        prompt = summarizer._build_prompt(content, kind, n, extra)
+        assert needle in prompt
+        assert f"{n} words" in prompt
+        assert content in prompt
     
-    @pytest.mark.asyncio
-    async def test_generate_fact(self, mock_openai_response):
+    async def test_generate_fact(self, summarizer, monkeypatch, mock_openai_response):
         """Test fact generation."""
-        summarizer = Summarizer()
-        
         # Mock the OpenAI client
-        summarizer.client.chat.completions.create = AsyncMock(
-            return_value=mock_openai_response
-        )
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(mock_openai_response))
         
         result = await summarizer.generate_fact("World War 1", "ww1", 100)
         
         assert result == "This is a test summary."
         
         # Verify the call included WW1 prompt
-        call_args = summarizer.client.chat.completions.create.call_args
-        messages = call_args[1]['messages']
+        messages = summarizer.client.chat.completions.create.calls[-1].kwargs['messages']
         assert any("World War 1" in msg['content'] for msg in messages)
     
-    @pytest.mark.asyncio
-    async def test_batch_summarize(self, mock_openai_response):
+    async def test_batch_summarize(self, summarizer, monkeypatch, mock_openai_stream):
         """Test batch summarization."""
-        summarizer = Summarizer()
-        
         # Mock the OpenAI client
-        summarizer.client.chat.completions.create = AsyncMock(
-            return_value=mock_openai_response
-        )
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(mock_openai_stream))
         
         items = [
             {"key": "item1", "content": "Content 1", "type": "summary"},
@@ -271,4 +347,83 @@ class TestSummarizer:
         assert results["item2"] == "This is a test summary."
         
         # Verify multiple calls were made
-        assert summarizer.client.chat.completions.create.call_count == 2
\ No newline at end of file
+        assert len(summarizer.client.chat.completions.create.calls) == 2
+    
+    async def test_batch_summarize_dedupes_identical_items(self, summarizer, monkeypatch):
+        """Test items with identical content and type are summarized once."""
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(Exception("API Error")))
+        
+        items = [
+            {"key": "item1", "content": "Same content", "type": "summary"},
+            {"key": "item2", "content": "Same content", "type": "summary"},
+            {"key": "item3", "content": "Same content", "type": "keypoints"},
+        ]
+        
+        results = await summarizer.batch_summarize(items, 100)
+        
+        assert results["item1"] == results["item2"]
+        assert set(results) == {"item1", "item2", "item3"}
+        # Failed summaries are not cached, so only the dedupe saves the call
+        assert len(summarizer.client.chat.completions.create.calls) == 2
+    
+    async def test_batch_generate_single_request(self, summarizer, monkeypatch):
+        """Test batch generation issues one JSON request for all specs."""
+        mock_response = _chat_response(json.dumps({
+            "WW1_FACT": "A WW1 fact.",
+            "GOLF": "A golf summary.",
+        }))
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(mock_response))
+        
+        results = await summarizer.batch_generate([
+            {"key": "WW1_FACT", "type": "ww1", "content": "", "word_limit": 50},
+            {"key": "GOLF", "type": "golf_summary", "content": "Arizona", "word_limit": 150},
+        ])
+        
+        assert results == {"WW1_FACT": "A WW1 fact.", "GOLF": "A golf summary."}
+        assert len(summarizer.client.chat.completions.create.calls) == 1
+        
+        call_kwargs = summarizer.client.chat.completions.create.calls[-1].kwargs
+        assert call_kwargs['response_format'] == {"type": "json_object"}
+        prompt = call_kwargs['messages'][1]['content']
+        assert "World War 1" in prompt
+        assert "Arizona" in prompt
+    
+    async def test_batch_generate_falls_back_on_bad_json(self, summarizer, monkeypatch, mock_openai_response):
+        """Test batch generation falls back to individual requests."""
+        bad_response = _chat_response("not json")
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(bad_response, mock_openai_response))
+        
+        results = await summarizer.batch_generate([
+            {"key": "WW1_FACT", "type": "ww1", "content": "", "word_limit": 50},
+        ])
+        
+        assert results == {"WW1_FACT": "This is a test summary."}
+        assert len(summarizer.client.chat.completions.create.calls) == 2
+    
+    async def test_fact_cache_is_per_calendar_date(self, summarizer, monkeypatch, mock_openai_response):
+        """Test a fact cached yesterday is not reused today, however recent."""
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(mock_openai_response))
+        monkeypatch.setattr('src.generators.summariser.date', SimpleNamespace(today=lambda: date(2025, 7, 8)))
+        
+        # Cached at 23:59 the day before, so the entry is only 23h59m old today
+        almost_a_day_ago = time.time() - (FACT_CACHE_TTL_SECONDS - 60)
+        with patch('src.utils.summary_cache.time.time', return_value=almost_a_day_ago):
+            await summarizer.generate_fact("", "ww1", 50)
+        await summarizer.generate_fact("", "ww1", 50)
+        assert len(summarizer.client.chat.completions.create.calls) == 1
+        
+        monkeypatch.setattr('src.generators.summariser.date', SimpleNamespace(today=lambda: date(2025, 7, 9)))
+        await summarizer.generate_fact("", "ww1", 50)
+        assert len(summarizer.client.chat.completions.create.calls) == 2
+    
+    async def test_batch_generate_uses_cache(self, summarizer, monkeypatch, mock_openai_response):
+        """Test facts generated once are reused by later fact requests."""
+        monkeypatch.setattr(summarizer.client.chat.completions, "create", _async_stub(mock_openai_response))
+        
+        fact = await summarizer.generate_fact("", "ww1", 50)
+        results = await summarizer.batch_generate([
+            {"key": "WW1_FACT", "type": "ww1", "content": "", "word_limit": 50},
+        ])
+        
+        assert results == {"WW1_FACT": fact}
+        assert len(summarizer.client.chat.completions.create.calls) == 1
@@ -0,0 +1,18 @@
+"""Tests for logging utilities."""
+import json
+
+from src.utils.logger import _orjson_dumps
+
+
+class TestOrjsonDumps:
+    """Test the structlog serializer."""
+    
+    def test_non_string_keys(self):
+        """Test mappings with int keys serialize like json.dumps."""
+        event = {"event": "Loaded", "per_year": {1980: "Alabama"}}
+        
+        assert json.loads(_orjson_dumps(event)) == {"event": "Loaded", "per_year": {"1980": "Alabama"}}
+    
+    def test_default_fallback(self):
+        """Test unsupported values go through structlog's default."""
+        assert json.loads(_orjson_dumps({"value": {1}}, default=list)) == {"value": [1]}
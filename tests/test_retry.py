@@ -0,0 +1,36 @@
+"""Tests for retry utilities."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.utils.retry import NonRetryableError, async_retry
+
+
+class TestAsyncRetry:
+    """Test async retry decorator."""
+    
+    async def test_retries_until_success(self):
+        """Test transient errors are retried with delays inside the bounds."""
+        func = AsyncMock(side_effect=[ValueError("boom"), ValueError("boom"), "ok"])
+        decorated = async_retry(max_attempts=3, initial_delay=1.0, max_delay=3.0)(func)
+        
+        with patch('src.utils.retry.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = await decorated()
+        
+        assert result == "ok"
+        assert func.await_count == 3
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert len(delays) == 2
+        assert all(1.0 <= delay <= 3.0 for delay in delays)
+    
+    async def test_non_retryable_error_raised_immediately(self):
+        """Test NonRetryableError skips the remaining attempts."""
+        func = AsyncMock(side_effect=NonRetryableError("fatal"))
+        decorated = async_retry(max_attempts=3)(func)
+        
+        with patch('src.utils.retry.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            with pytest.raises(NonRetryableError):
+                await decorated()
+        
+        assert func.await_count == 1
+        mock_sleep.assert_not_awaited()
@@ -1,6 +1,6 @@
 """Tests for template engine."""
-import tempfile
-from pathlib import Path
+import os
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -11,19 +11,28 @@ from src.template_engine import TemplateEngine
 class TestTemplateEngine:
     """Test template engine functionality."""
     
-    @pytest.fixture
-    def temp_template_dir(self):
-        """Create a temporary template directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    @pytest.fixture(scope="session")
+    def temp_template_dir(self, tmp_path_factory):
+        """Create one temporary template directory for the whole session."""
+        return tmp_path_factory.mktemp("templates")
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def template_engine(self, temp_template_dir):
-        """Create template engine with temporary directory."""
-        with patch('src.template_engine.settings') as mock_settings:
-            mock_settings.templates_dir = temp_template_dir
+        """Create one template engine over the shared directory."""
+        with patch('src.template_engine.settings', SimpleNamespace(templates_dir=temp_template_dir)):
             return TemplateEngine()
     
+    @pytest.fixture
+    def template_name(self, request, temp_template_dir):
+        """Per-test template file name, so cached templates never collide.
+        
+        Only the file this test wrote is removed afterwards; the shared
+        directory is left for the session.
+        """
+        name = f"{request.node.name}.txt"
+        yield name
+        (temp_template_dir / name).unlink(missing_ok=True)
+    
     def test_rotate_phrase_deterministic(self, template_engine):
         """Test phrase rotation with seed is deterministic."""
         phrases = ["phrase1", "phrase2", "phrase3"]
@@ -42,23 +51,19 @@ class TestTemplateEngine:
         result = template_engine._rotate_phrase([], seed="test")
         assert result == ""
     
-    def test_render_template(self, temp_template_dir, template_engine):
+    def test_render_template(self, template_engine):
         """Test template rendering."""
-        # Create a test template
         template_content = """Hello {{ name }}!
 Today is {{ date }}.
 Let's {{ GET_TO_IT_SAYING }} the work."""
         
-        template_path = temp_template_dir / "test_template.txt"
-        template_path.write_text(template_content)
-        
         # Render template
         context = {
             "name": "Garrett",
             "date": "Wednesday",
         }
         
-        result = template_engine.render_template("test_template.txt", context)
+        result = template_engine.render_string(template_content, context)
         
         assert "Hello Garrett!" in result
         assert "Today is Wednesday." in result
@@ -67,17 +72,33 @@ Let's {{ GET_TO_IT_SAYING }} the work."""
         # GET_TO_IT_SAYING should be auto-populated
         assert any(phrase in result for phrase in template_engine.get_to_it_phrases)
     
-    def test_get_template_variables(self, temp_template_dir, template_engine):
+    def test_render_template_uses_cache(self, temp_template_dir, template_engine, template_name):
+        """Test compiled templates are reused until the template file changes."""
+        template_path = temp_template_dir / template_name
+        template_path.write_text("Hello {{ name }}!")
+        
+        loader = template_engine.env.loader
+        with patch.object(loader, 'load', wraps=loader.load) as mock_load:
+            template_engine.render_template(template_name, {"name": "first"})
+            result = template_engine.render_template(template_name, {"name": "second"})
+            assert result == "Hello second!"
+            assert mock_load.call_count == 1
+            
+            # A newer modification time reloads the template
+            template_path.write_text("Bye {{ name }}!")
+            stat = template_path.stat()
+            os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            result = template_engine.render_template(template_name, {"name": "third"})
+            assert result == "Bye third!"
+            assert mock_load.call_count == 2
+    
+    def test_get_template_variables(self, template_engine):
         """Test extracting variables from template."""
-        # Create a test template
         template_content = """{{ var1 }} and {{ var2 }}
 {% if condition %}{{ var3 }}{% endif %}
 {{ var1 }} again"""
         
-        template_path = temp_template_dir / "test_template.txt"
-        template_path.write_text(template_content)
-        
-        variables = template_engine.get_template_variables("test_template.txt")
+        variables = template_engine.get_string_variables(template_content)
         
         # Should find unique variables
         assert "var1" in variables
@@ -85,12 +106,12 @@ Let's {{ GET_TO_IT_SAYING }} the work."""
         assert "var3" in variables
         assert len(set(variables)) == len(variables)  # No duplicates
     
-    def test_validate_context(self, temp_template_dir, template_engine):
+    def test_validate_context(self, temp_template_dir, template_engine, template_name):
         """Test context validation."""
         # Create a test template
         template_content = "{{ required1 }} and {{ required2 }}"
         
-        template_path = temp_template_dir / "test_template.txt"
+        template_path = temp_template_dir / template_name
         template_path.write_text(template_content)
         
         # Test with complete context
@@ -98,36 +119,51 @@ Let's {{ GET_TO_IT_SAYING }} the work."""
             "required1": "value1",
             "required2": "value2",
         }
-        missing = template_engine.validate_context("test_template.txt", complete_context)
+        missing = template_engine.validate_context(template_name, complete_context)
         assert len(missing) == 0
         
         # Test with incomplete context
         incomplete_context = {
             "required1": "value1",
         }
-        missing = template_engine.validate_context("test_template.txt", incomplete_context)
+        missing = template_engine.validate_context(template_name, incomplete_context)
         assert "required2" in missing
         assert len(missing) == 1
     
+    def test_template_variables_cached_until_modified(self, temp_template_dir, template_engine, template_name):
+        """Test variables are re-parsed only when the template file changes."""
+        template_path = temp_template_dir / template_name
+        template_path.write_text("{{ first }}")
+        
+        loader = template_engine.env.loader
+        with patch.object(loader, 'get_source', wraps=loader.get_source) as mock_get_source:
+            assert template_engine.get_template_variables(template_name) == ["first"]
+            assert template_engine.validate_context(template_name, {"first": 1}) == []
+            assert mock_get_source.call_count == 1
+            
+            # A newer modification time invalidates the cached variables
+            template_path.write_text("{{ second }}")
+            stat = template_path.stat()
+            os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            assert template_engine.get_template_variables(template_name) == ["second"]
+            assert mock_get_source.call_count == 2
+    
     def test_render_template_error_handling(self, template_engine):
         """Test error handling in template rendering."""
         # Try to render non-existent template
         with pytest.raises(Exception):
             template_engine.render_template("non_existent.txt", {})
     
-    def test_custom_filters(self, temp_template_dir, template_engine):
+    def test_custom_filters(self, template_engine):
         """Test custom filters are available."""
-        # Create a template using custom filter
+        # Template using custom filter
         template_content = "{{ phrases|rotate_phrase }}"
         
-        template_path = temp_template_dir / "test_template.txt"
-        template_path.write_text(template_content)
-        
         context = {
             "phrases": ["option1", "option2", "option3"]
         }
         
-        result = template_engine.render_template("test_template.txt", context)
+        result = template_engine.render_string(template_content, context)
         
         # Should be one of the options
         assert result.strip() in ["option1", "option2", "option3"]
\ No newline at end of file